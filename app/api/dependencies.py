@@ -0,0 +1,64 @@
+"""Shared API Dependencies"""
+
+import threading
+from typing import Optional
+
+from fastapi import HTTPException
+
+from app.models.session import ParsedSessionId
+from app.services.execution_service import ExecutionService
+from app.services.storage_service import StorageService
+from app.services.session_service import SessionService
+from app.services.config_service import ConfigService
+from app.services.api_executor import APIExecutorService
+from app.services.comparison_service import ComparisonService
+from app.services.llm_reporter import LLMReporterService
+
+_execution_service: Optional[ExecutionService] = None
+_execution_service_lock = threading.Lock()
+
+
+def get_execution_service() -> ExecutionService:
+    """
+    Dependency injection for ExecutionService.
+
+    One instance is built on first use and shared by every route module and
+    request; services hold no per-request state.
+
+    Returns:
+        Shared ExecutionService
+    """
+    global _execution_service
+
+    if _execution_service is None:
+        with _execution_service_lock:
+            if _execution_service is None:
+                _execution_service = ExecutionService(
+                    storage_service=StorageService(),
+                    session_service=SessionService(),
+                    config_service=ConfigService(),
+                    api_executor=APIExecutorService(),
+                    comparison_service=ComparisonService(),
+                    llm_reporter=LLMReporterService()
+                )
+
+    return _execution_service
+
+
+def parsed_session_id(session_id: str) -> ParsedSessionId:
+    """
+    Dependency that parses the `session_id` path parameter once per request.
+
+    Args:
+        session_id: Session identifier (format: username_date_timestamp)
+
+    Returns:
+        Parsed session ID
+
+    Raises:
+        HTTPException: If the session ID has no username part (422)
+    """
+    parsed = ParsedSessionId.parse(session_id)
+    if not parsed.username:
+        raise HTTPException(status_code=422, detail=f"Malformed session ID: {session_id}")
+    return parsed
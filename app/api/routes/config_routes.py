@@ -5,21 +5,114 @@ Endpoints:
 - GET /api/config/products/{category} - Get products for category
 - GET /api/config/plans/{category}/{product} - Get plans for product
 - GET /api/config/full - Get full product hierarchy
+- POST /api/config/reload - Rebuild cached config payloads
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from typing import Any, Callable, Dict, Tuple
+import hashlib
 import logging
+import math
+import time
 
+import orjson
+
+from app.core.config import settings
 from app.services.config_service import ConfigService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/config", tags=["config"])
+router = APIRouter(
+    prefix="/api/config",
+    tags=["config"],
+    default_response_class=ORJSONResponse
+)
 config_service = ConfigService()
 
+# cache key -> (expires_at, body, etag)
+_response_cache: Dict[str, Tuple[float, bytes, str]] = {}
+
+# Payloads built once at startup and kept until an explicit reload
+_STATIC_PAYLOADS: Dict[str, Callable[[], Any]] = {
+    "categories": lambda: {"categories": config_service.get_all_categories()},
+    "full": config_service.get_full_hierarchy,
+}
+
+
+def _store(key: str, payload: Any, expires_at: float) -> Tuple[float, bytes, str]:
+    """Serialize a payload once and store it with its ETag."""
+    body = orjson.dumps(payload, default=str)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    entry = (expires_at, body, etag)
+    _response_cache[key] = entry
+    return entry
+
+
+def _warm_static_payloads():
+    """Pre-serialize the static config payloads."""
+    for key, build in _STATIC_PAYLOADS.items():
+        _store(key, build(), math.inf)
+    logger.info(f"Config payloads cached: {', '.join(_STATIC_PAYLOADS)}")
+
+
+def _cached_json(request: Request, key: str, build: Callable[[], Any]) -> Response:
+    """
+    Serve a config payload from the in-process cache with an ETag.
+
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        key: Cache key for the payload
+        build: Callable producing the payload on a cache miss
+
+    Returns:
+        304 response if the client copy is current, otherwise JSON response
+    """
+    ttl = settings.config_cache_ttl_seconds
+    now = time.monotonic()
+    entry = _response_cache.get(key)
+
+    if entry is None or entry[0] <= now:
+        expires_at = math.inf if key in _STATIC_PAYLOADS else now + ttl
+        entry = _store(key, build(), expires_at)
+
+    _, body, etag = entry
+    headers = {"ETag": etag, "Cache-Control": f"max-age={ttl}"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.on_event("startup")
+async def warm_config_cache():
+    """Build the static config payloads before the first request."""
+    try:
+        _warm_static_payloads()
+    except Exception as e:
+        logger.error(f"Failed to warm config cache: {e}", exc_info=True)
+
+
+@router.post("/reload")
+async def reload_config():
+    """
+    Drop cached config payloads and rebuild them from products.json.
+
+    Returns:
+        Keys of the rebuilt static payloads
+    """
+    try:
+        _response_cache.clear()
+        _warm_static_payloads()
+        return {"reloaded": list(_STATIC_PAYLOADS)}
+    except Exception as e:
+        logger.error(f"Failed to reload config: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
 
 @router.get("/categories")
-async def get_categories():
+async def get_categories(request: Request):
     """
     Get all available product categories.
 
@@ -27,16 +120,14 @@ async def get_categories():
         List of category IDs (MV4, MV2, PET, PA, TRAVEL)
     """
     try:
-        categories = config_service.get_all_categories()
-        logger.debug(f"Retrieved categories: {len(categories)}")
-        return {"categories": categories}
+        return _cached_json(request, "categories", _STATIC_PAYLOADS["categories"])
     except Exception as e:
         logger.error(f"Failed to get categories: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/products/{category}")
-async def get_products(category: str):
+async def get_products(request: Request, category: str):
     """
     Get all products for a specific category.
 
@@ -50,9 +141,14 @@ async def get_products(category: str):
         HTTPException: If category doesn't exist (404)
     """
     try:
-        products = config_service.get_products_for_category(category)
-        logger.debug(f"Retrieved products for {category}: {len(products)}")
-        return {"category": category, "products": products}
+        return _cached_json(
+            request,
+            f"products:{category}",
+            lambda: {
+                "category": category,
+                "products": config_service.get_products_for_category(category)
+            }
+        )
     except ValueError as e:
         logger.warning(f"Category not found: {category}")
         raise HTTPException(status_code=404, detail=str(e))
@@ -62,7 +158,7 @@ async def get_products(category: str):
 
 
 @router.get("/plans/{category}/{product}")
-async def get_plans(category: str, product: str):
+async def get_plans(request: Request, category: str, product: str):
     """
     Get all plans for a specific product.
 
@@ -77,13 +173,15 @@ async def get_plans(category: str, product: str):
         HTTPException: If category or product doesn't exist (404)
     """
     try:
-        plans = config_service.get_plans_for_product(category, product)
-        logger.debug(f"Retrieved plans for {category}/{product}: {len(plans)}")
-        return {
-            "category": category,
-            "product_id": product,
-            "plans": plans
-        }
+        return _cached_json(
+            request,
+            f"plans:{category}:{product}",
+            lambda: {
+                "category": category,
+                "product_id": product,
+                "plans": config_service.get_plans_for_product(category, product)
+            }
+        )
     except ValueError as e:
         logger.warning(f"Product not found: {category}/{product}")
         raise HTTPException(status_code=404, detail=str(e))
@@ -93,7 +191,7 @@ async def get_plans(category: str, product: str):
 
 
 @router.get("/full")
-async def get_full_hierarchy():
+async def get_full_hierarchy(request: Request):
     """
     Get complete product hierarchy.
 
@@ -101,9 +199,7 @@ async def get_full_hierarchy():
         Full configuration with categories, products, and plans
     """
     try:
-        hierarchy = config_service.get_full_hierarchy()
-        logger.debug("Retrieved full product hierarchy")
-        return hierarchy
+        return _cached_json(request, "full", _STATIC_PAYLOADS["full"])
     except Exception as e:
         logger.error(f"Failed to get full hierarchy: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -5,14 +5,20 @@ Endpoints:
 - GET /api/execution/status/{session_id} - Get overall status
 - GET /api/execution/tabs/{session_id} - Get all tabs
 - GET /api/execution/progress/{session_id} - Get session progress for all executions
+- GET /api/execution/progress/{session_id}/stream - Stream session progress as Server-Sent Events
 - GET /api/execution/{session_id}/api-call/{call_id} - Get API call details
 - GET /api/execution/{session_id}/comparison/{call_id} - Get comparison results
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, Any
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 import logging
 import asyncio
+import itertools
+from collections import Counter
+
+import orjson
 
 from app.schemas.execution import (
     ExecutionStartRequest,
@@ -22,42 +28,136 @@ from app.schemas.execution import (
     TabProgressResponse,
     ExecutionProgressResponse
 )
+from app.models.execution import ExecutionSpec
 from app.schemas.comparison import APICallDetails, ComparisonResponse, ApiComparisonResponse
 from app.services.execution_service import ExecutionService
-from app.services.storage_service import StorageService
-from app.services.session_service import SessionService
-from app.services.config_service import ConfigService
-from app.services.api_executor import APIExecutorService
-from app.services.comparison_service import ComparisonService
-from app.services.llm_reporter import LLMReporterService
+from app.api.dependencies import get_execution_service, parsed_session_id
+from app.models.session import ParsedSessionId
+from app.core.cache import CacheKey, ResponseCache
+from app.core.concurrency import SingleFlight
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/execution", tags=["execution"])
-
-
-def get_execution_service() -> ExecutionService:
-    """Dependency injection for ExecutionService."""
-    storage_service = StorageService()
-    session_service = SessionService()
-    config_service = ConfigService()
-    api_executor = APIExecutorService()
-    comparison_service = ComparisonService()
-    llm_reporter = LLMReporterService()
-
-    return ExecutionService(
-        storage_service=storage_service,
-        session_service=session_service,
-        config_service=config_service,
-        api_executor=api_executor,
-        comparison_service=comparison_service,
-        llm_reporter=llm_reporter
-    )
+router = APIRouter(
+    prefix="/api/execution",
+    tags=["execution"],
+    default_response_class=ORJSONResponse
+)
+
+_execution_queue: Optional[asyncio.Queue] = None
+_execution_workers: List[asyncio.Task] = []
+# Execution jobs queued or running per session; progress streams end once it drops to zero
+_active_jobs: Counter = Counter()
+# Consecutive failed progress reads after which a stream gives up
+_STREAM_MAX_ERRORS = 5
+# Coalesces simultaneous status polls for the same session into one read
+_status_reads = SingleFlight()
+# Encoded /status, /tabs and /progress bodies, reused across polls for a short TTL
+_polling_cache = ResponseCache(settings.polling_cache_ttl_seconds, settings.polling_cache_max_entries)
+
+
+async def _run_execution_job(
+    username: str,
+    session_id: str,
+    config: Dict[str, Any],
+    specs: Optional[List[ExecutionSpec]] = None
+):
+    """Run a queued execution job, executing its combinations concurrently."""
+    try:
+        engine = get_execution_service().engine
+
+        logger.info("[API-START] Starting execution for user %s, session %s", username, session_id)
+        result = await engine.execute_master_async(
+            username,
+            session_id,
+            config,
+            max_concurrency=settings.max_concurrent_combinations,
+            specs=specs
+        )
+
+        if result["success"]:
+            logger.info("[API-START] Execution completed: %s/%s combinations successful", result['successful_combinations'], result['total_combinations'])
+        else:
+            logger.error("[API-START] Execution failed: %s", result.get('error'))
+
+    except Exception as e:
+        logger.error("[API-START] Background execution failed: %s", e, exc_info=True)
+    finally:
+        _active_jobs[session_id] -= 1
+        if _active_jobs[session_id] <= 0:
+            del _active_jobs[session_id]
+
+
+async def _execution_worker(queue: asyncio.Queue):
+    """Consume execution jobs from the queue one at a time."""
+    while True:
+        job = await queue.get()
+        try:
+            await _run_execution_job(**job)
+        finally:
+            queue.task_done()
+
+
+def _get_execution_queue() -> asyncio.Queue:
+    """Return the execution queue, starting the worker pool on first use."""
+    global _execution_queue
+
+    if _execution_queue is None:
+        _execution_queue = asyncio.Queue()
+        for _ in range(settings.execution_worker_count):
+            _execution_workers.append(
+                asyncio.create_task(_execution_worker(_execution_queue))
+            )
+        logger.info("[API-START] Started %d execution workers", len(_execution_workers))
+
+    return _execution_queue
+
+
+async def _enqueue_execution_job(job: Dict[str, Any]):
+    """Queue an execution job for the worker pool."""
+    queue = _get_execution_queue()
+    # Counted right before the put (the queue is unbounded, so it can't block or
+    # fail) so every counted job reaches _run_execution_job, which uncounts it
+    _active_jobs[job['session_id']] += 1
+    await queue.put(job)
+    logger.debug("[API-START] Job queued for session %s (%d waiting)", job['session_id'], _execution_queue.qsize())
+
+
+@router.on_event("startup")
+async def start_execution_workers():
+    """Start the execution worker pool."""
+    _get_execution_queue()
+
+
+@router.on_event("shutdown")
+async def stop_execution_workers():
+    """Cancel the execution worker pool."""
+    global _execution_queue
+
+    for worker in _execution_workers:
+        worker.cancel()
+    await asyncio.gather(*_execution_workers, return_exceptions=True)
+    _execution_workers.clear()
+    _execution_queue = None
+
+
+@router.on_event("startup")
+async def warm_execution_service():
+    """Load product config and the execution engine before the first request."""
+    try:
+        execution_service = get_execution_service()
+        execution_service.config_service.get_all_categories()
+        execution_service.engine  # builds the shared engine
+        logger.info("ExecutionService warmed up")
+    except Exception as e:
+        logger.error("Failed to warm ExecutionService: %s", e, exc_info=True)
 
 
 @router.post("/start", response_model=ExecutionStartResponse, status_code=202)
 async def start_execution(
     request: ExecutionStartRequest,
+    background_tasks: BackgroundTasks,
     execution_service: ExecutionService = Depends(get_execution_service)
 ):
     """
@@ -76,9 +176,8 @@ async def start_execution(
         HTTPException: If session not found (404)
     """
     try:
-        # Extract username from session_id (format: username_date_timestamp)
-        username = request.session_id.split('_')[0]
-        logger.info(f"[API-START] Starting execution for user {username}")
+        username = ParsedSessionId.parse(request.session_id).username
+        logger.info("[API-START] Starting execution for user %s", username)
 
         # Prepare config for execution engine
         config = {
@@ -89,51 +188,43 @@ async def start_execution(
         }
 
         # Generate execution IDs based on combinations (before actual execution)
-        from app.services.config_service import ConfigService
-        config_service = ConfigService()
-        combinations = config_service.get_all_combinations(config["categories"])
-
-        execution_ids = []
-        for combination in combinations:
-            execution_id = f"{username}_{request.target_environment.lower()}_{combination['category']}_{combination['product_id']}_{combination['plan_id']}"
-            execution_ids.append(execution_id)
-
-        logger.info(f"[API-START] Generated {len(execution_ids)} execution IDs")
-
-        # Start execution using new ExecutionEngine
-        def background_execution():
-            try:
-                from app.services.execution_engine import ExecutionEngine
-                engine = ExecutionEngine()
+        combinations = execution_service.config_service.get_all_combinations(config["categories"])
 
-                logger.info(f"[API-START] Starting sequential execution for user {username}, session {request.session_id}")
-                result = engine.execute_master(username, request.session_id, config)
+        environment = request.target_environment.lower()
+        specs = [
+            ExecutionSpec(
+                execution_id=f"{username}_{environment}_{combination['category']}_{combination['product_id']}_{combination['plan_id']}",
+                category=combination["category"],
+                product_id=combination["product_id"],
+                plan_id=combination["plan_id"]
+            )
+            for combination in combinations
+        ]
 
-                if result["success"]:
-                    logger.info(f"[API-START] Sequential execution completed: {result['successful_combinations']}/{result['total_combinations']} combinations successful")
-                else:
-                    logger.error(f"[API-START] Sequential execution failed: {result.get('error')}")
+        logger.info("[API-START] Generated %d execution IDs", len(specs))
 
-            except Exception as e:
-                logger.error(f"[API-START] Background execution failed: {e}", exc_info=True)
+        _polling_cache.invalidate_session(request.session_id)
 
-        # Run in background thread
-        import threading
-        thread = threading.Thread(target=background_execution, daemon=True)
-        thread.start()
+        # Hand the job to the worker pool once the response has been sent
+        background_tasks.add_task(_enqueue_execution_job, {
+            "username": username,
+            "session_id": request.session_id,
+            "config": config,
+            "specs": specs
+        })
 
-        logger.info(f"[API-START] Background execution thread started for user {username}")
+        logger.info("[API-START] Execution queued for user %s", username)
 
         return ExecutionStartResponse(
             session_id=request.session_id,
-            executions=execution_ids
+            executions=[spec.execution_id for spec in specs]
         )
 
     except ValueError as e:
-        logger.warning(f"Execution start failed: {e}")
+        logger.warning("Execution start failed: %s", e)
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Unexpected error starting execution: {e}", exc_info=True)
+        logger.error("Unexpected error starting execution: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -154,15 +245,116 @@ async def get_execution_status(
     Raises:
         HTTPException: If session not found (404)
     """
+    cache_key = ("status", session_id)
+    cached = _polling_cache.get(cache_key)
+    if cached is not None:
+        return _cached_response(cached, "HIT")
+
     try:
-        status = execution_service.get_execution_status(session_id)
-        return status
+        status = await _status_reads.do(
+            session_id,
+            lambda: asyncio.to_thread(execution_service.get_execution_status, session_id)
+        )
+        # Already shaped by the service; skip response_model re-validation
+        body = orjson.dumps(status.model_dump())
+        _polling_cache.set(cache_key, body)
+        return _cached_response(body, "MISS")
     except ValueError as e:
-        logger.warning(f"Session not found: {session_id}")
+        logger.warning("Session not found: %s", session_id)
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to get execution status: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.error("Failed to get execution status: %s", e, exc_info=True)
+        return _stale_response_or_raise(cache_key, e)
+
+
+def _stream_session_json(
+    session_id: str,
+    field: str,
+    items: Iterable[Any],
+    as_mapping: bool = False,
+    cache_key: Optional[CacheKey] = None,
+    cache_version: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None
+) -> StreamingResponse:
+    """
+    Stream `{"session_id": ..., field: ...}` encoding one item at a time with orjson.
+
+    Args:
+        session_id: Session identifier written at the head of the document
+        field: Name of the collection field
+        items: Items for a JSON array, or (key, value) pairs when `as_mapping`
+        as_mapping: Emit the collection as a JSON object instead of an array
+        cache_key: Store the complete body in the polling cache under this key
+        cache_version: Data version the cached body is tagged with
+        headers: Extra response headers
+
+    Returns:
+        StreamingResponse with a chunked JSON body
+    """
+    open_bracket, close_bracket = (b"{", b"}") if as_mapping else (b"[", b"]")
+
+    def body() -> Iterator[bytes]:
+        chunks = [b'{"session_id":' + orjson.dumps(session_id) + b',' + orjson.dumps(field) + b':' + open_bracket]
+        yield chunks[0]
+        separator = b""
+        complete = True
+        try:
+            for item in items:
+                if as_mapping:
+                    key, value = item
+                    chunk = orjson.dumps(key) + b":" + orjson.dumps(value)
+                else:
+                    chunk = orjson.dumps(item)
+                chunks.append(separator + chunk)
+                yield chunks[-1]
+                separator = b","
+        except Exception as e:
+            # Headers are already sent; close the document so it stays valid JSON
+            logger.error("Failed while streaming %s for session %s: %s", field, session_id, e, exc_info=True)
+            complete = False
+        chunks.append(close_bracket + b"}")
+        yield chunks[-1]
+
+        if cache_key and complete:
+            _polling_cache.set(cache_key, b"".join(chunks), version=cache_version)
+
+    return StreamingResponse(
+        body(),
+        media_type="application/json",
+        headers={**(headers or {}), "X-Cache": "MISS"}
+    )
+
+
+def _cached_response(body: bytes, state: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Wrap an encoded polling body, tagging where it came from in X-Cache."""
+    return Response(body, media_type="application/json", headers={**(headers or {}), "X-Cache": state})
+
+
+def _next_poll_ms(request: Request, unchanged: bool) -> int:
+    """
+    Suggest the client's next polling delay.
+
+    Resets to min_poll_ms when data changed; otherwise grows the delay the
+    client reports in `X-Poll-Ms` by poll_backoff_factor, up to max_poll_ms.
+    """
+    if not unchanged:
+        return settings.min_poll_ms
+
+    try:
+        current = int(request.headers.get("x-poll-ms", settings.min_poll_ms))
+    except ValueError:
+        current = settings.min_poll_ms
+
+    return max(settings.min_poll_ms, min(settings.max_poll_ms, int(current * settings.poll_backoff_factor)))
+
+
+def _stale_response_or_raise(cache_key: CacheKey, error: Exception) -> Response:
+    """Serve the last good body for a failing poll, or raise a 500 if there is none."""
+    stale = _polling_cache.get_stale(cache_key)
+    if stale is None:
+        raise HTTPException(status_code=500, detail=str(error))
+    logger.warning("Serving stale %s for session %s", cache_key[0], cache_key[1])
+    return _cached_response(stale, "STALE")
 
 
 @router.get("/tabs/{session_id}", response_model=TabsListResponse)
@@ -182,25 +374,38 @@ async def get_execution_tabs(
     Raises:
         HTTPException: If session not found (404)
     """
+    cache_key = ("tabs", session_id)
+    cached = _polling_cache.get(cache_key)
+    if cached is not None:
+        return _cached_response(cached, "HIT")
+
     try:
-        tabs = execution_service.get_execution_tabs(session_id)
-        return tabs
+        tabs = await asyncio.to_thread(execution_service.iter_execution_tabs, session_id)
+        return _stream_session_json(session_id, "tabs", tabs, cache_key=cache_key)
     except ValueError as e:
-        logger.warning(f"Session not found: {session_id}")
+        logger.warning("Session not found: %s", session_id)
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to get execution tabs: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.error("Failed to get execution tabs: %s", e, exc_info=True)
+        return _stale_response_or_raise(cache_key, e)
 
 
 @router.get("/progress/{session_id}", response_model=ExecutionProgressResponse)
-async def get_session_progress(session_id: str):
+async def get_session_progress(
+    session_id: str,
+    request: Request,
+    parsed_id: ParsedSessionId = Depends(parsed_session_id)
+):
     """
     Get progress for all executions in a session.
 
     Reads progress from JSON files in the session directory and returns
     structured data for UI polling with proper failure handling.
 
+    Responses carry an ETag derived from the progress files' mtimes; a matching
+    If-None-Match gets 304. X-Next-Poll-Ms suggests when to poll again, backing
+    off while nothing changes.
+
     Args:
         session_id: Session identifier
 
@@ -210,21 +415,131 @@ async def get_session_progress(session_id: str):
     Raises:
         HTTPException: If session not found (404)
     """
-    try:
-        # Extract username from session_id (format: username_date_timestamp)
-        username = session_id.split('_')[0]
+    engine = get_execution_service().engine
+    etag = f'W/"{await asyncio.to_thread(engine.get_session_progress_version, session_id)}"'
+    unchanged = request.headers.get("if-none-match") == etag
+    headers = {"ETag": etag, "X-Next-Poll-Ms": str(_next_poll_ms(request, unchanged))}
 
-        from app.services.execution_engine import ExecutionEngine
-        engine = ExecutionEngine()
+    if unchanged:
+        return Response(status_code=304, headers=headers)
 
-        progress = engine.get_session_progress(username, session_id)
-        return progress
+    cache_key = ("progress", session_id)
+    cached = _polling_cache.get(cache_key, version=etag)
+    if cached is not None:
+        return _cached_response(cached, "HIT", headers)
+
+    try:
+        progress = engine.iter_session_progress(parsed_id.username, session_id)
+        # Run the generator up to its first item here so directory setup and
+        # scan errors reach the handlers below instead of truncating a 200
+        first = await asyncio.to_thread(next, progress, None)
+        if first is not None:
+            progress = itertools.chain((first,), progress)
+        return _stream_session_json(
+            session_id,
+            "executions",
+            progress,
+            as_mapping=True,
+            cache_key=cache_key,
+            cache_version=etag,
+            headers=headers
+        )
     except ValueError as e:
-        logger.warning(f"Session not found: {session_id}")
+        logger.warning("Session not found: %s", session_id)
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to get session progress: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.error("Failed to get session progress: %s", e, exc_info=True)
+        return _stale_response_or_raise(cache_key, e)
+
+
+@router.get("/progress/{session_id}/stream")
+async def stream_session_progress(
+    session_id: str,
+    parsed_id: ParsedSessionId = Depends(parsed_session_id)
+):
+    """
+    Stream progress for all executions in a session as Server-Sent Events.
+
+    The progress files' fingerprint is checked every PROGRESS_STREAM_INTERVAL_MS
+    with a directory scan only; the files are read and an event is sent only
+    when it changes. The first event carries the same payload as GET /progress;
+    later `delta` events carry only the executions whose progress changed (a
+    full event is sent again if an execution disappears).
+
+    Once the session has no queued or running execution job, i.e. every
+    execution has completed or failed, any final progress is sent followed by a
+    `complete` event and the stream ends. Failed reads back off up to
+    MAX_POLL_MS and end the stream after a few consecutive failures; the client
+    then falls back to polling.
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        text/event-stream response
+    """
+    engine = get_execution_service().engine
+    interval = settings.progress_stream_interval_ms / 1000
+    keepalive_every = max(1, int(settings.progress_stream_keepalive_seconds / interval))
+
+    def read_progress() -> Dict[str, Dict[str, str]]:
+        return dict(engine.iter_session_progress(parsed_id.username, session_id))
+
+    async def events():
+        last_version = None
+        last_executions: Optional[Dict[str, Dict[str, str]]] = None
+        idle_ticks = 0
+        errors = 0
+
+        while True:
+            # Checked before the read so progress written by the last job is included
+            finished = session_id not in _active_jobs
+            try:
+                version = await asyncio.to_thread(engine.get_session_progress_version, session_id)
+                if version != last_version:
+                    executions = await asyncio.to_thread(read_progress)
+                    if last_executions is None or not last_executions.keys() <= executions.keys():
+                        event, changed = b"", executions
+                    else:
+                        event = b"event: delta\n"
+                        changed = {
+                            execution_id: progress
+                            for execution_id, progress in executions.items()
+                            if last_executions.get(execution_id) != progress
+                        }
+                    last_version = version
+                    last_executions = executions
+                    idle_ticks = 0
+                    if changed or not event:
+                        payload = orjson.dumps({"session_id": session_id, "executions": changed})
+                        yield event + b"id: " + version.encode() + b"\ndata: " + payload + b"\n\n"
+                else:
+                    idle_ticks += 1
+                    if idle_ticks >= keepalive_every:
+                        idle_ticks = 0
+                        yield b": keep-alive\n\n"
+                errors = 0
+            except Exception as e:
+                errors += 1
+                if errors >= _STREAM_MAX_ERRORS:
+                    logger.error("Ending progress stream for %s after %d failed reads: %s", session_id, errors, e)
+                    return
+                # Full traceback once per failure streak
+                logger.error("Failed to stream progress for %s: %s", session_id, e, exc_info=errors == 1)
+                await asyncio.sleep(min(settings.max_poll_ms / 1000, interval * 2 ** errors))
+                continue
+
+            if finished:
+                yield b"event: complete\ndata: " + orjson.dumps({"session_id": session_id}) + b"\n\n"
+                return
+
+            await asyncio.sleep(interval)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get("/{session_id}/api-call/{call_id}", response_model=APICallDetails)
@@ -247,40 +562,33 @@ async def get_api_call(
         HTTPException: If API call not found (404)
     """
     try:
-        storage_service = StorageService()
-        session_service = SessionService()
+        storage_service = execution_service.storage
+        session_service = execution_service.session_service
 
-        session = session_service.get_session(session_id)
+        session = await asyncio.to_thread(session_service.get_session, session_id)
 
         if not session:
             raise ValueError(f"Session not found: {session_id}")
 
-        comparisons = []
-        execution_id = None  # Initialize to avoid unbound variable warning
-
-        for execution_id in session.executions:
-            execution_data = storage_service.read_execution(execution_id)
-
-            if execution_data:
-                comparisons.extend(execution_data.get("comparisons", []))
+        comparisons, comparisons_by_id = await asyncio.to_thread(
+            storage_service.read_session_comparisons,
+            session_id,
+            session.executions
+        )
 
-        comparison = None
         target_response = None
         staging_response = None
 
         # Find comparison for this call
-        for comp in comparisons:
-            if comp.get("call_id") == call_id or call_id in comp.get("comparison_id", ""):
-                comparison = comp
-                break
+        comparison = comparisons_by_id.get(call_id) or next(
+            (comp for comp in comparisons if call_id in comp.get("comparison_id", "")),
+            None
+        )
 
         if not comparison:
-            # Fallback: find by api_step
-            api_calls = []
-            for execution_id in session.executions:
-                execution_data = storage_service.read_execution(execution_id)
-                if execution_data:
-                    api_calls.extend(execution_data.get("api_calls", []))
+            # Fallback: find by api_step, reading every execution once, concurrently
+            executions_data = await storage_service.read_executions_batch(session.executions)
+            api_calls = [c for data in executions_data if data for c in data.get("api_calls", [])]
 
             target_call = None
             staging_call = None
@@ -303,7 +611,7 @@ async def get_api_call(
                 }
 
         if not comparison:
-            logger.warning(f"Comparison not found for call: {call_id}")
+            logger.warning("Comparison not found for call: %s", call_id)
             raise HTTPException(status_code=404, detail="Comparison not found")
 
         return ComparisonResponse(
@@ -318,10 +626,10 @@ async def get_api_call(
         )
 
     except ValueError as e:
-        logger.warning(f"Resource not found: {e}")
+        logger.warning("Resource not found: %s", e)
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to get API call: {e}", exc_info=True)
+        logger.error("Failed to get API call: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -345,57 +653,71 @@ async def get_comparison(
         HTTPException: If comparison not found (404)
     """
     try:
-        session_service = SessionService()
-        storage_service = StorageService()
+        session_service = execution_service.session_service
+        storage_service = execution_service.storage
 
-        session = session_service.get_session(session_id)
+        session = await asyncio.to_thread(session_service.get_session, session_id)
 
         if not session:
             raise ValueError(f"Session not found: {session_id}")
 
-        comparisons = []
-        execution_id = None  # Initialize to avoid unbound variable warning
-
-        for execution_id in session.executions:
-            execution_data = storage_service.read_execution(execution_id)
-
-            if execution_data:
-                comparisons.extend(execution_data.get("comparisons", []))
+        _, comparisons_by_id = await asyncio.to_thread(
+            storage_service.read_session_comparisons,
+            session_id,
+            session.executions
+        )
+        comparisons_by_execution = await asyncio.to_thread(
+            storage_service.read_session_comparisons_by_execution,
+            session_id,
+            session.executions
+        )
 
-        comparison = None
+        comparison = comparisons_by_id.get(call_id)
 
-        for comp in comparisons:
-            if comp.get("comparison_id", "").startswith(f"cmp_{execution_id}"):
-                comparison = comp
-                break
+        if not comparison:
+            # call_id format: call_{execution_id}_{api_step}_{environment}
+            owning_executions = [
+                exec_id for exec_id in session.executions
+                if call_id.startswith(f"call_{exec_id}_") or call_id == exec_id
+            ]
+            if owning_executions:
+                execution_id = max(owning_executions, key=len)
+            else:
+                execution_id = session.executions[-1] if session.executions else None
+            execution_comparisons = comparisons_by_execution.get(execution_id, [])
+            if execution_comparisons:
+                comparison = execution_comparisons[0]
 
         if not comparison:
-            for comp in comparisons:
-                call_id_parts = call_id.split("_")
-                if any(part in comp.get("comparison_id", "") for part in call_id_parts):
-                    comparison = comp
-                    break
+            comparison = await asyncio.to_thread(
+                storage_service.find_comparison_by_call_parts,
+                session_id,
+                session.executions,
+                call_id
+            )
 
         if not comparison:
-            logger.warning(f"Comparison not found for call: {call_id}")
+            logger.warning("Comparison not found for call: %s", call_id)
             raise HTTPException(status_code=404, detail="Comparison not found")
 
-        return ComparisonResponse(
-            comparison_id=comparison.get("comparison_id"),
-            call_id=call_id,
-            target_environment=comparison.get("target_environment"),
-            staging_environment=comparison.get("staging_environment"),
-            target_response=comparison.get("target_response"),
-            staging_response=comparison.get("staging_response"),
-            differences=comparison.get("differences", []),
-            summary=comparison.get("summary", {})
-        )
+        # Stored comparisons already have the ComparisonResponse shape; encode
+        # directly instead of building and re-validating a Pydantic model
+        return ORJSONResponse({
+            "comparison_id": comparison.get("comparison_id"),
+            "call_id": call_id,
+            "target_environment": comparison.get("target_environment"),
+            "staging_environment": comparison.get("staging_environment"),
+            "target_response": comparison.get("target_response"),
+            "staging_response": comparison.get("staging_response"),
+            "differences": comparison.get("differences", []),
+            "summary": comparison.get("summary", {})
+        })
 
     except ValueError as e:
-        logger.warning(f"Resource not found: {e}")
+        logger.warning("Resource not found: %s", e)
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to get comparison: {e}", exc_info=True)
+        logger.error("Failed to get comparison: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -423,10 +745,11 @@ async def get_api_comparison(
     """
     try:
         result = execution_service.get_api_comparison(execution_id, api_step)
-        return result
+        # Already shaped by the service; skip response_model re-validation
+        return ORJSONResponse(result)
     except ValueError as e:
-        logger.warning(f"API comparison not found: {e}")
+        logger.warning("API comparison not found: %s", e)
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to get API comparison: {e}", exc_info=True)
+        logger.error("Failed to get API comparison: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to load comparison data")
@@ -5,20 +5,31 @@ Endpoints:
 - GET /api/reports/execution/{execution_id} - Get execution report
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
+import asyncio
 import logging
 
+from app.core.config import settings
 from app.schemas.report import SessionSummaryReport, ExecutionReport
-from app.services.execution_service import ExecutionService
-from app.services.llm_reporter import LLMReporterService
-from app.services.storage_service import StorageService
+from app.api.dependencies import get_execution_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/reports", tags=["report"])
-execution_service = ExecutionService()
-reporter = LLMReporterService()
-storage_service = StorageService()
+# Report generation (LLM calls once integrated) runs on its own pool so slow
+# model responses can't tie up the default executor used by other handlers.
+_report_executor = ThreadPoolExecutor(
+    max_workers=settings.report_worker_count,
+    thread_name_prefix="report"
+)
+
+router = APIRouter(
+    prefix="/api/reports",
+    tags=["report"],
+    default_response_class=ORJSONResponse
+)
 
 
 @router.get("/session/{session_id}", response_model=SessionSummaryReport)
@@ -36,23 +47,33 @@ async def get_session_report(session_id: str):
         HTTPException: If session not found (404)
     """
     try:
-        session = execution_service.session_service.get_session(session_id)
+        execution_service = get_execution_service()
+        storage_service = execution_service.storage
+        reporter = execution_service.reporter
+
+        session = await asyncio.to_thread(execution_service.session_service.get_session, session_id)
 
         if not session:
             raise ValueError(f"Session not found: {session_id}")
 
-        executions_data = []
-
-        for execution_id in session.executions:
-            execution_data.append(storage_service.read_execution(execution_id))
+        # Read every execution concurrently, skipping ones whose files are gone
+        executions_data = [
+            execution_data
+            for execution_data in await storage_service.read_executions_batch(session.executions)
+            if execution_data is not None
+        ]
 
-        report = reporter.generate_session_report(
-            session_id=session_id,
-            session_data=session.dict() if hasattr(session, 'dict') else session,
-            executions=executions_data
+        report = await asyncio.get_running_loop().run_in_executor(
+            _report_executor,
+            partial(
+                reporter.generate_session_report,
+                session_id=session_id,
+                session_data=session.dict() if hasattr(session, 'dict') else session,
+                executions=executions_data
+            )
         )
 
-        return SessionSummaryReport(
+        session_report = SessionSummaryReport(
             session_id=report["session_id"],
             total_executions=report["total_executions"],
             completed_executions=report["completed_executions"],
@@ -63,6 +84,9 @@ async def get_session_report(session_id: str):
             summary=report["summary"]
         )
 
+        # Validated above; encode with orjson instead of response_model + jsonable_encoder
+        return ORJSONResponse(session_report.model_dump())
+
     except ValueError as e:
         logger.warning(f"Session not found: {session_id}")
         raise HTTPException(status_code=404, detail=str(e))
@@ -86,17 +110,25 @@ async def get_execution_report(execution_id: str):
         HTTPException: If execution not found (404)
     """
     try:
-        execution_data = storage_service.read_execution(execution_id)
+        execution_service = get_execution_service()
+        storage_service = execution_service.storage
+        reporter = execution_service.reporter
+
+        execution_data = await storage_service.read_execution_async(execution_id)
 
         if not execution_data:
             raise ValueError(f"Execution not found: {execution_id}")
 
         comparisons = execution_data.get("comparisons", [])
 
-        report = reporter.generate_execution_report(
-            execution_id=execution_id,
-            execution_data=execution_data,
-            comparisons=comparisons
+        report = await asyncio.get_running_loop().run_in_executor(
+            _report_executor,
+            partial(
+                reporter.generate_execution_report,
+                execution_id=execution_id,
+                execution_data=execution_data,
+                comparisons=comparisons
+            )
         )
 
         critical_issues = [
@@ -121,7 +153,7 @@ async def get_execution_report(execution_id: str):
             for bd in report.api_breakdown
         ]
 
-        return ExecutionReport(
+        execution_report = ExecutionReport(
             execution_id=execution_id,
             status=execution_data.get("status", "unknown"),
             has_failures=execution_data.get("has_failures", False),
@@ -130,6 +162,9 @@ async def get_execution_report(execution_id: str):
             recommendations=recommendations
         )
 
+        # Validated above; encode with orjson instead of response_model + jsonable_encoder
+        return ORJSONResponse(execution_report.model_dump())
+
     except ValueError as e:
         logger.warning(f"Execution not found: {execution_id}")
         raise HTTPException(status_code=404, detail=str(e))
@@ -7,7 +7,8 @@ Endpoints:
 """
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+import asyncio
 import logging
 
 from app.schemas.session import SessionCreate, SessionResponse, SessionListResponse
@@ -15,7 +16,11 @@ from app.services.session_service import SessionService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/session", tags=["session"])
+router = APIRouter(
+    prefix="/api/session",
+    tags=["session"],
+    default_response_class=ORJSONResponse
+)
 session_service = SessionService()
 
 
@@ -58,7 +63,7 @@ async def get_session(session_id: str):
     Raises:
         HTTPException: If session not found (404)
     """
-    session = session_service.get_session(session_id)
+    session = await asyncio.to_thread(session_service.get_session, session_id)
 
     if not session:
         logger.warning(f"Session not found: {session_id}")
@@ -81,5 +86,5 @@ async def list_sessions():
     Returns:
         List of all sessions
     """
-    sessions = session_service.get_session_list()
+    sessions = await asyncio.to_thread(session_service.get_session_list)
     return SessionListResponse(sessions=sessions)
@@ -0,0 +1,48 @@
+"""Response Cache
+
+Short-lived in-process cache for encoded polling responses. Expired entries
+are kept so a failing backend can still be answered with the last good body,
+up to a maximum entry count (least recently stored dropped first).
+"""
+
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# (endpoint, session_id)
+CacheKey = Tuple[str, str]
+
+
+class ResponseCache:
+    """TTL cache of encoded response bodies with stale fallback."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # key -> (expires_at, body, version), oldest stored first
+        self._entries: "OrderedDict[CacheKey, Tuple[float, bytes, Optional[str]]]" = OrderedDict()
+
+    def get(self, key: CacheKey, version: Optional[str] = None) -> Optional[bytes]:
+        """Return the cached body if it is still fresh and was stored for `version`."""
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic() and entry[2] == version:
+            return entry[1]
+        return None
+
+    def get_stale(self, key: CacheKey) -> Optional[bytes]:
+        """Return the last stored body regardless of age."""
+        entry = self._entries.get(key)
+        return entry[1] if entry else None
+
+    def set(self, key: CacheKey, body: bytes, version: Optional[str] = None):
+        """Store an encoded body for ttl_seconds, optionally tagged with a data version."""
+        if self.ttl_seconds > 0 and self.max_entries > 0:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, body, version)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_session(self, session_id: str):
+        """Drop every cached response belonging to a session."""
+        for key in [key for key in self._entries if key[1] == session_id]:
+            self._entries.pop(key, None)
@@ -0,0 +1,99 @@
+"""Concurrency Helpers"""
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into a single in-flight call.
+
+    Callers arriving while a call for the same key is running await that call's
+    result instead of starting their own. Nothing is cached once it completes.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `func` for `key`, or join the call already in flight for it.
+
+        Args:
+            key: Identifier shared by equivalent calls
+            func: Zero-argument coroutine function producing the result
+
+        Returns:
+            Result of the shared call
+        """
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        # Shield so one cancelled waiter doesn't cancel the read for the others
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+
+class CoalescingFileWriter:
+    """
+    Write file snapshots on a background thread, keeping only the newest per path.
+
+    Callers hand over fully serialized bytes and return immediately. If a path
+    is written again before its previous snapshot reached disk, the older one
+    is dropped. Files are replaced atomically, so readers never see a partial
+    snapshot.
+    """
+
+    def __init__(self, thread_name_prefix: str = "file-writer"):
+        self._pending: Dict[Path, bytes] = {}
+        self._lock = threading.Lock()
+        # A single worker keeps writes to the same path in submission order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=thread_name_prefix)
+
+    def submit(self, path: Path, data: bytes):
+        """
+        Queue `data` to be written to `path`, replacing any snapshot still queued for it.
+
+        Args:
+            path: Destination file
+            data: Serialized file contents
+        """
+        with self._lock:
+            already_queued = path in self._pending
+            self._pending[path] = data
+
+        if not already_queued:
+            self._executor.submit(self._write, path)
+
+    def flush(self):
+        """Block until every snapshot submitted so far has been written."""
+        self._executor.submit(lambda: None).result()
+
+    def _write(self, path: Path):
+        with self._lock:
+            data = self._pending.pop(path, None)
+
+        if data is None:
+            return
+
+        temp_path = path.with_suffix(".tmp")
+        try:
+            temp_path.write_bytes(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.error("Background write failed for %s: %s", path, e)
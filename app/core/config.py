@@ -1,5 +1,6 @@
 """Application Configuration Settings"""
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from typing import Dict
@@ -8,12 +9,38 @@ from typing import Dict
 class Settings(BaseSettings):
     app_name: str = "Internal Testing Portal"
     debug: bool = True
+    log_level: str = "INFO"
     polling_interval_seconds: int = 3
+    min_poll_ms: int = 500
+    max_poll_ms: int = 8000
+    poll_backoff_factor: float = 2.0
+    progress_stream_interval_ms: int = 500
+    progress_stream_keepalive_seconds: int = 15
+    config_cache_ttl_seconds: int = 300
+    comparison_index_ttl_seconds: int = 5
+    execution_cache_ttl_seconds: int = 5
+    execution_cache_max_entries: int = 256
+    polling_cache_ttl_seconds: int = 2
+    polling_cache_max_entries: int = 256
+    progress_cache_max_sessions: int = 64
+    comparison_index_max_sessions: int = 16
+    inline_read_max_bytes: int = 65536
 
     max_sessions: int = 5
     max_executions_per_session: int = 10
+    execution_worker_count: int = 4
+    max_concurrent_combinations: int = 8
+    max_concurrent_api_calls: int = 32
+    # Random pause between dependent API layers of a combination; max 0 disables it
+    api_layer_delay_min_seconds: int = 1
+    api_layer_delay_max_seconds: int = 3
+    report_worker_count: int = 2
     storage_path: str = "storage"
 
+    # "auto" picks uvloop/httptools when installed, falling back to asyncio/h11
+    uvicorn_loop: str = "auto"
+    uvicorn_http: str = "auto"
+
     huggingface_api_key: str = ""
     huggingface_model: str = "gpt2"
 
@@ -28,4 +55,11 @@ class Settings(BaseSettings):
         "extra": "ignore"
     }
 
-settings = Settings()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, reading the environment and .env once."""
+    return Settings()
+
+
+settings = get_settings()
@@ -3,18 +3,23 @@
 import logging
 import sys
 
+from app.core.config import settings
+
 
 def setup_logging(app_name: str = "InternalTestingPortal"):
     """Setup and configure application logging"""
+    # LOG_LEVEL=WARNING drops INFO chatter from polling endpoints early
+    level = settings.log_level.upper()
+
     logger = logging.getLogger(app_name)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(level)
     
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
+    console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
     
     logger.addHandler(console_handler)
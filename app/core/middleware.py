@@ -0,0 +1,22 @@
+"""Application Middleware"""
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+class OptionalGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that can be bypassed per request with `x-no-compression`.
+
+    Server-Sent Event requests are never compressed: the gzip stream doesn't
+    flush per chunk, so events would sit in the compressor.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            if "x-no-compression" in headers or "text/event-stream" in headers.get("accept", ""):
+                await self.app(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
@@ -1,8 +1,11 @@
 """Product Configuration Loader"""
 
-import json
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+import orjson
+
 from app.core.logging import logger
 
 
@@ -11,11 +14,17 @@ class ProductConfigLoader:
 
     def __init__(self):
         self.config_path = "config/products.json"
+        self._config: Optional[Dict[str, Any]] = None
+        self._mtime_ns = 0
+        self._lock = threading.Lock()
 
     def load_config(self) -> Dict[str, Any]:
         """
         Load product hierarchy configuration from JSON file.
 
+        The parsed config is kept in memory and only re-read when the file's
+        mtime changes.
+
         Returns:
             Configuration dictionary (unwrapped from "categories" key)
         """
@@ -28,16 +37,27 @@ class ProductConfigLoader:
                 )
                 return {}
 
-            with open(full_path, 'r') as f:
-                config = json.load(f)
+            mtime_ns = full_path.stat().st_mtime_ns
+            if self._config is not None and mtime_ns == self._mtime_ns:
+                return self._config
+
+            with self._lock:
+                # Another thread may have refreshed while we waited
+                if self._config is not None and mtime_ns == self._mtime_ns:
+                    return self._config
+
+                config = orjson.loads(full_path.read_bytes())
+
+                if "categories" in config:
+                    config = config["categories"]
 
-            if "categories" in config:
-                config = config["categories"]
+                self._config = config
+                self._mtime_ns = mtime_ns
 
             logger.info(f"Loaded product configuration from {self.config_path}")
             return config
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON in product config: {e}")
             return {}
 
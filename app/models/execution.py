@@ -1,7 +1,7 @@
 """Execution Data Model"""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional
 from pydantic import BaseModel, Field
 
 
@@ -19,3 +19,19 @@ class Execution(BaseModel):
     comparisons: Optional[List[dict]] = None
     reports: dict
     has_failures: bool = False
+
+
+class ExecutionSpec(NamedTuple):
+    """Execution ID together with the combination it was built from."""
+    execution_id: str
+    category: str
+    product_id: str
+    plan_id: str
+
+    @property
+    def combination(self) -> Dict[str, str]:
+        return {
+            "category": self.category,
+            "product_id": self.product_id,
+            "plan_id": self.plan_id
+        }
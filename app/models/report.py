@@ -1,8 +1,9 @@
 """Report Data Model"""
 
+import time
 from datetime import datetime
 from typing import List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 
 class APIBreakdown(BaseModel):
@@ -22,9 +23,15 @@ class Issue(BaseModel):
 class Report(BaseModel):
     report_id: str
     execution_id: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    created_ns: int = Field(default_factory=time.time_ns, exclude=True)
     executive_summary: str
     api_breakdown: List[APIBreakdown]
     critical_issues: List[Issue]
     recommendations: List[str]
     overall_status: str
+
+    @computed_field
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time (local), built from created_ns only when read or dumped."""
+        return datetime.fromtimestamp(self.created_ns / 1e9)
@@ -1,6 +1,8 @@
 """Session Data Model"""
 
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import List
 from pydantic import BaseModel, Field
 
@@ -13,3 +15,23 @@ class Session(BaseModel):
     config: dict
     executions: List[str]
     execution_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedSessionId:
+    """Session ID split into its parts (format: username_date_timestamp)."""
+    raw: str
+    username: str
+    date: str = ""
+    timestamp: str = ""
+
+    @staticmethod
+    def parse(session_id: str) -> "ParsedSessionId":
+        return _parse_session_id(session_id)
+
+
+@lru_cache(maxsize=256)
+def _parse_session_id(session_id: str) -> ParsedSessionId:
+    username, _, rest = session_id.partition('_')
+    date, _, timestamp = rest.partition('_')
+    return ParsedSessionId(raw=session_id, username=username, date=date, timestamp=timestamp)
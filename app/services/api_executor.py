@@ -13,20 +13,75 @@ API Steps:
 7. Customer Policy Details
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Protocol, Tuple
 import time
 import logging
+import threading
+from datetime import datetime
+
+import httpx
 
 from app.models.api_call import APICall
-from app.utils import dummy_payloads, dummy_responses
 
 logger = logging.getLogger(__name__)
 
+# Constant fields of a failed call; execute_api_call copies it with the
+# per-call fields and fresh payload/response dicts filled in.
+_ERROR_CALL_TEMPLATE = APICall.model_construct(
+    call_id="",
+    execution_id="",
+    tab_id="",
+    api_step="",
+    environment="",
+    endpoint="",
+    request_payload={},
+    response_data={},
+    status_code=500,
+    execution_time_ms=0,
+    error=None
+)
+
+
+class StepDataSource(Protocol):
+    """Produces the request payload and response for one API step."""
+
+    def get(
+        self,
+        api_step: str,
+        category: str,
+        product_id: str,
+        plan_id: str,
+        /,
+        **kwargs
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        ...
+
+
+class DummyStepDataSource:
+    """Step data from the dummy payload/response modules (until Phase 5)."""
+
+    def __init__(self):
+        # Imported here so a real data source never loads the dummy modules
+        from app.utils.dummy_responses import get_payload_and_response_for_step
+        self.get = get_payload_and_response_for_step
+
 
 class APIExecutorService:
     """Service for executing API calls."""
 
-    def __init__(self):
+    # Process-wide connection pool to the target environments. Opened at app
+    # startup and shared by every executor so calls reuse TCP/TLS connections.
+    _http_client: Optional[httpx.Client] = None
+    _http_client_lock = threading.Lock()
+
+    def __init__(self, data_source: Optional[StepDataSource] = None):
+        """
+        Initialize API executor.
+
+        Args:
+            data_source: Source of step payloads/responses (dummy data by default)
+        """
+        self._data_source = data_source or DummyStepDataSource()
         self.api_steps = [
             "application_submit",
             "apply_coupon",
@@ -36,6 +91,43 @@ class APIExecutorService:
             "customer_policy_list",
             "customer_policy_details"
         ]
+        # Set for membership checks, precomputed endpoint paths per step
+        self._api_step_set = frozenset(self.api_steps)
+        self._endpoints = {step: f"/api/v1/{step.replace('_', '-')}" for step in self.api_steps}
+        self._step_roles = {
+            step: "admin" if "admin" in step else "customer" if "customer" in step else None
+            for step in self.api_steps
+        }
+
+    @classmethod
+    def open_client(cls) -> httpx.Client:
+        """
+        Create the shared HTTP client if it isn't open yet.
+
+        Returns:
+            Shared client for calls to the DEV/QA/STAGING APIs
+        """
+        if cls._http_client is None:
+            with cls._http_client_lock:
+                if cls._http_client is None:
+                    cls._http_client = httpx.Client(
+                        timeout=httpx.Timeout(30.0, connect=10.0),
+                        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+                    )
+        return cls._http_client
+
+    @classmethod
+    def close_client(cls):
+        """Close the shared HTTP client, if one was opened."""
+        with cls._http_client_lock:
+            if cls._http_client is not None:
+                cls._http_client.close()
+                cls._http_client = None
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """Shared HTTP client, opened on first use if startup didn't open it."""
+        return self.open_client()
 
     def execute_api_call(
         self,
@@ -68,40 +160,33 @@ class APIExecutorService:
         try:
             call_id = f"call_{execution_id}_{api_step}_{environment.lower()}"
 
-            if api_step not in self.api_steps:
+            if api_step not in self._api_step_set:
                 raise ValueError(f"Unknown API step: {api_step}")
 
-            start_time = time.time()
-
-            payload = dummy_payloads.get_payload_for_step(
-                api_step,
-                category,
-                product_id,
-                plan_id,
-                **self._get_payload_kwargs(api_step, auth_token, application_id)
-            )
+            start_ns = time.perf_counter_ns()
 
-            response = dummy_responses.get_response_for_step(
+            payload, response = self._data_source.get(
                 api_step,
                 category,
                 product_id,
                 plan_id,
-                **self._get_response_kwargs(api_step, auth_token, application_id)
+                **self._get_step_kwargs(api_step, auth_token, application_id)
             )
 
-            execution_time_ms = int((time.time() - start_time) * 1000)
+            execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             # Check response status - dummy responses can indicate failures
             status_code = response.get("status_code", 200)
             error = response.get("error") if status_code != 200 else None
 
-            api_call = APICall(
+            # Payload/response are generated in-process; skip validation
+            api_call = APICall.model_construct(
                 call_id=call_id,
                 execution_id=execution_id,
                 tab_id=tab_id,
                 api_step=api_step,
                 environment=environment,
-                endpoint=f"/api/v1/{self._normalize_step_name(api_step)}",
+                endpoint=self._endpoints[api_step],
                 request_payload=payload,
                 response_data=response,
                 status_code=status_code,
@@ -110,27 +195,26 @@ class APIExecutorService:
             )
 
             logger.info(
-                f"API call executed: {api_step} in {environment} "
-                f"({execution_time_ms}ms) - {status_code}"
+                "API call executed: %s in %s (%dms) - %s",
+                api_step, environment, execution_time_ms, status_code
             )
 
             return api_call
 
         except Exception as e:
-            logger.error(f"Failed to execute API call {api_step}: {e}", exc_info=True)
-            return APICall(
-                call_id=f"call_{execution_id}_{api_step}_{environment.lower()}",
-                execution_id=execution_id,
-                tab_id=tab_id,
-                api_step=api_step,
-                environment=environment,
-                endpoint=f"/api/v1/{self._normalize_step_name(api_step)}",
-                request_payload={},
-                response_data={},
-                status_code=500,
-                execution_time_ms=0,
-                error=str(e)
-            )
+            logger.error("Failed to execute API call %s: %s", api_step, e, exc_info=True)
+            return _ERROR_CALL_TEMPLATE.model_copy(update={
+                "call_id": f"call_{execution_id}_{api_step}_{environment.lower()}",
+                "execution_id": execution_id,
+                "tab_id": tab_id,
+                "api_step": api_step,
+                "environment": environment,
+                "endpoint": self._get_endpoint(api_step),
+                "request_payload": {},
+                "response_data": {},
+                "error": str(e),
+                "timestamp": datetime.now()
+            })
 
     def execute_7_step_flow(
         self,
@@ -195,14 +279,15 @@ class APIExecutorService:
 
             if api_call.status_code != 200:
                 logger.warning(
-                    f"API call failed: {step} in {environment} - "
-                    f"continuing with remaining steps"
+                    "API call failed: %s in %s - continuing with remaining steps",
+                    step, environment
                 )
 
-        logger.info(
-            f"Completed 7-step flow for {tab_id} in {environment}: "
-            f"{len([c for c in api_calls if c.status_code == 200])}/7 successful"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Completed 7-step flow for %s in %s: %d/7 successful",
+                tab_id, environment, sum(1 for c in api_calls if c.status_code == 200)
+            )
 
         return api_calls
 
@@ -223,19 +308,20 @@ class APIExecutorService:
         Returns:
             Appropriate token or None
         """
-        if "admin" in api_step:
+        role = self._step_roles.get(api_step)
+        if role == "admin":
             return admin_token
-        elif "customer" in api_step:
+        elif role == "customer":
             return customer_token
         return None
 
-    def _get_payload_kwargs(
+    def _get_step_kwargs(
         self,
         api_step: str,
         auth_token: Optional[str],
         application_id: Optional[str]
     ) -> Dict[str, Any]:
-        """Get kwargs for payload generation based on API step."""
+        """Get kwargs for payload and response generation based on API step."""
         kwargs = {}
 
         if api_step in ["admin_policy_list", "customer_policy_list"]:
@@ -251,15 +337,7 @@ class APIExecutorService:
 
         return kwargs
 
-    def _get_response_kwargs(
-        self,
-        api_step: str,
-        auth_token: Optional[str],
-        application_id: Optional[str]
-    ) -> Dict[str, Any]:
-        """Get kwargs for response generation based on API step."""
-        return self._get_payload_kwargs(api_step, auth_token, application_id)
-
-    def _normalize_step_name(self, api_step: str) -> str:
-        """Convert API step name to endpoint format."""
-        return api_step.replace("_", "-")
+    def _get_endpoint(self, api_step: str) -> str:
+        """Get the endpoint path for an API step (built on the fly for unknown steps)."""
+        endpoint = self._endpoints.get(api_step)
+        return endpoint if endpoint is not None else f"/api/v1/{api_step.replace('_', '-')}"
@@ -1,8 +1,8 @@
 """Individual API Functions for Sequential Execution
 
 This module contains dedicated functions for each of the 7 API steps in the insurance purchase flow.
-Each function handles the complete API call process including payload generation, response processing,
-and standardized error handling.
+Each function is a thin wrapper over a shared dispatcher driven by the step table below, which handles
+payload generation, response processing, and standardized error handling.
 
 API Steps:
 1. Application Submit - Creates new insurance application
@@ -14,129 +14,153 @@ API Steps:
 7. Customer Policy Details - Gets specific policy details (customer view)
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 import logging
 
-from app.utils import dummy_payloads, dummy_responses
+from app.utils import dummy_responses
 
 logger = logging.getLogger(__name__)
 
-def call_application_submit(combination: Dict[str, str]) -> Dict[str, Any]:
+ADMIN_TOKEN = "admin_token_123"
+CUSTOMER_TOKEN = "customer_token_123"
+
+# Per-step metadata for _call_step:
+#   failure_message: error reported when the API does not return success
+#   success_log: %-style message, formatted with the call's ids and extracted fields
+#   extract: result fields built from (response, ids) on success
+_STEP_SPECS: Dict[str, Dict[str, Any]] = {
+    "application_submit": {
+        "failure_message": "Application submission failed",
+        "success_log": "Application submitted successfully: %(application_id)s",
+        "extract": {"application_id": lambda response, ids: response.get("application_id")}
+    },
+    "apply_coupon": {
+        "failure_message": "Coupon application failed",
+        "success_log": "Coupon applied successfully to application %(application_id)s",
+        "extract": {"application_id": lambda response, ids: ids["application_id"]}
+    },
+    "payment_checkout": {
+        "failure_message": "Payment processing failed",
+        "success_log": "Payment processed successfully for application %(application_id)s",
+        "extract": {
+            "application_id": lambda response, ids: ids["application_id"],
+            "policy_number": lambda response, ids: response.get("policy_number")
+        }
+    },
+    "admin_policy_list": {
+        "failure_message": "Failed to retrieve admin policy list",
+        "success_log": "Admin policy list retrieved successfully: %(policy_count)s policies",
+        "extract": {"policies": lambda response, ids: response.get("policies", [])}
+    },
+    "admin_policy_details": {
+        "failure_message": "Failed to retrieve admin policy details",
+        "success_log": "Admin policy details retrieved successfully for policy %(policy_id)s",
+        "extract": {"policy": lambda response, ids: response}
+    },
+    "customer_policy_list": {
+        "failure_message": "Failed to retrieve customer policy list",
+        "success_log": "Customer policy list retrieved successfully: %(policy_count)s policies",
+        "extract": {"policies": lambda response, ids: response.get("policies", [])}
+    },
+    "customer_policy_details": {
+        "failure_message": "Failed to retrieve customer policy details",
+        "success_log": "Customer policy details retrieved successfully for policy %(policy_id)s",
+        "extract": {"policy": lambda response, ids: response}
+    }
+}
+
+
+def _call_step(step_name: str, combination: Dict[str, str], **ids: str) -> Dict[str, Any]:
     """
-    Call Application Submit API.
-
-    Creates a new insurance application.
+    Call one API step as described by its entry in _STEP_SPECS.
 
     Args:
+        step_name: API step name
         combination: Dict containing category, product_id, plan_id
+        **ids: Step inputs (application_id, policy_id, admin_token, customer_token)
 
     Returns:
         Dict with standardized API response
     """
-    try:
-        logger.debug(f"Calling application_submit for {combination}")
+    spec = _STEP_SPECS[step_name]
+    label = step_name.replace("_", " ").capitalize()
 
-        # Generate payload
-        payload = dummy_payloads.get_payload_for_step(
-            "application_submit",
-            combination["category"],
-            combination["product_id"],
-            combination["plan_id"]
-        )
+    try:
+        logger.debug("Calling %s for %s %s", step_name, combination, ids)
 
-        # Get response
-        response = dummy_responses.get_response_for_step(
-            "application_submit",
+        # Generate payload and get response
+        payload, response = dummy_responses.get_payload_and_response_for_step(
+            step_name,
             combination["category"],
             combination["product_id"],
-            combination["plan_id"]
+            combination["plan_id"],
+            **ids
         )
 
         # Validate response
         if not response or response.get("status") != "success":
-            logger.error(f"Application submit failed: {response}")
+            logger.error("%s failed: %s", label, response)
             return {
                 "success": False,
-                "error": response.get("error", "Application submission failed"),
+                "error": response.get("error", spec["failure_message"]),
                 "status_code": response.get("status_code", 500),
-                "api_step": "application_submit"
+                "api_step": step_name
             }
 
-        logger.info(f"Application submitted successfully: {response.get('application_id')}")
-        return {
-            "success": True,
-            "data": response,
-            "application_id": response.get("application_id"),
-            "api_step": "application_submit",
-            "status_code": 200
-        }
+        result = {"success": True, "data": response}
+        for field, extract in spec["extract"].items():
+            result[field] = extract(response, ids)
+        result["api_step"] = step_name
+        result["status_code"] = 200
+
+        if logger.isEnabledFor(logging.INFO):
+            log_fields = {**ids, **result}
+            if "policies" in result:
+                log_fields["policy_count"] = len(result["policies"])
+            logger.info(spec["success_log"], log_fields)
+
+        return result
 
     except Exception as e:
-        logger.error(f"Application submit error: {e}", exc_info=True)
+        logger.error("%s error: %s", label, e, exc_info=True)
         return {
             "success": False,
-            "error": f"Application submit failed: {str(e)}",
+            "error": f"{spec['failure_message']}: {str(e)}",
             "status_code": 500,
-            "api_step": "application_submit"
+            "api_step": step_name
         }
 
-def call_apply_coupon(combination: Dict[str, str], application_id: str) -> Dict[str, Any]:
+
+def call_application_submit(combination: Dict[str, str]) -> Dict[str, Any]:
     """
-    Call Apply Coupon API.
+    Call Application Submit API.
 
-    Applies a discount coupon to an existing application.
+    Creates a new insurance application.
 
     Args:
         combination: Dict containing category, product_id, plan_id
-        application_id: ID of the application to apply coupon to
 
     Returns:
         Dict with standardized API response
     """
-    try:
-        logger.debug(f"Calling apply_coupon for application {application_id}")
+    return _call_step("application_submit", combination)
 
-        # Generate payload with application_id
-        payload = dummy_payloads.get_payload_for_step(
-            "apply_coupon",
-            "", "", "",  # Not needed for this step
-            application_id=application_id
-        )
 
-        # Get response
-        response = dummy_responses.get_response_for_step(
-            "apply_coupon",
-            "", "", "",  # Not needed for this step
-            application_id=application_id
-        )
+def call_apply_coupon(combination: Dict[str, str], application_id: str) -> Dict[str, Any]:
+    """
+    Call Apply Coupon API.
 
-        # Validate response
-        if not response or response.get("status") != "success":
-            logger.error(f"Apply coupon failed: {response}")
-            return {
-                "success": False,
-                "error": response.get("error", "Coupon application failed"),
-                "status_code": response.get("status_code", 500),
-                "api_step": "apply_coupon"
-            }
+    Applies a discount coupon to an existing application.
 
-        logger.info(f"Coupon applied successfully to application {application_id}")
-        return {
-            "success": True,
-            "data": response,
-            "application_id": application_id,
-            "api_step": "apply_coupon",
-            "status_code": 200
-        }
+    Args:
+        combination: Dict containing category, product_id, plan_id
+        application_id: ID of the application to apply coupon to
+
+    Returns:
+        Dict with standardized API response
+    """
+    return _call_step("apply_coupon", combination, application_id=application_id)
 
-    except Exception as e:
-        logger.error(f"Apply coupon error: {e}", exc_info=True)
-        return {
-            "success": False,
-            "error": f"Coupon application failed: {str(e)}",
-            "status_code": 500,
-            "api_step": "apply_coupon"
-        }
 
 def call_payment_checkout(combination: Dict[str, str], application_id: str) -> Dict[str, Any]:
     """
@@ -151,53 +175,8 @@ def call_payment_checkout(combination: Dict[str, str], application_id: str) -> D
     Returns:
         Dict with standardized API response
     """
-    try:
-        logger.debug(f"Calling payment_checkout for application {application_id}")
-
-        # Generate payload with application_id
-        payload = dummy_payloads.get_payload_for_step(
-            "payment_checkout",
-            "", "", "",  # Not needed for this step
-            application_id=application_id
-        )
-
-        # Get response (pass combination for failure logic)
-        response = dummy_responses.get_response_for_step(
-            "payment_checkout",
-            combination["category"],
-            combination["product_id"],
-            combination["plan_id"],
-            application_id=application_id
-        )
-
-        # Validate response
-        if not response or response.get("status") != "success":
-            logger.error(f"Payment checkout failed: {response}")
-            return {
-                "success": False,
-                "error": response.get("error", "Payment processing failed"),
-                "status_code": response.get("status_code", 500),
-                "api_step": "payment_checkout"
-            }
+    return _call_step("payment_checkout", combination, application_id=application_id)
 
-        logger.info(f"Payment processed successfully for application {application_id}")
-        return {
-            "success": True,
-            "data": response,
-            "application_id": application_id,
-            "policy_number": response.get("policy_number"),
-            "api_step": "payment_checkout",
-            "status_code": 200
-        }
-
-    except Exception as e:
-        logger.error(f"Payment checkout error: {e}", exc_info=True)
-        return {
-            "success": False,
-            "error": f"Payment processing failed: {str(e)}",
-            "status_code": 500,
-            "api_step": "payment_checkout"
-        }
 
 def call_admin_policy_list(combination: Dict[str, str]) -> Dict[str, Any]:
     """
@@ -211,50 +190,8 @@ def call_admin_policy_list(combination: Dict[str, str]) -> Dict[str, Any]:
     Returns:
         Dict with standardized API response
     """
-    try:
-        logger.debug(f"Calling admin_policy_list for {combination}")
+    return _call_step("admin_policy_list", combination, admin_token=ADMIN_TOKEN)
 
-        # Generate payload
-        payload = dummy_payloads.get_payload_for_step(
-            "admin_policy_list",
-            "", "", "",  # Not needed for this step
-            admin_token="admin_token_123"
-        )
-
-        # Get response
-        response = dummy_responses.get_response_for_step(
-            "admin_policy_list",
-            "", "", "",  # Not needed for this step
-            admin_token="admin_token_123"
-        )
-
-        # Validate response
-        if not response or response.get("status") != "success":
-            logger.error(f"Admin policy list failed: {response}")
-            return {
-                "success": False,
-                "error": response.get("error", "Failed to retrieve admin policy list"),
-                "status_code": response.get("status_code", 500),
-                "api_step": "admin_policy_list"
-            }
-
-        logger.info(f"Admin policy list retrieved successfully: {len(response.get('policies', []))} policies")
-        return {
-            "success": True,
-            "data": response,
-            "policies": response.get("policies", []),
-            "api_step": "admin_policy_list",
-            "status_code": 200
-        }
-
-    except Exception as e:
-        logger.error(f"Admin policy list error: {e}", exc_info=True)
-        return {
-            "success": False,
-            "error": f"Failed to retrieve admin policy list: {str(e)}",
-            "status_code": 500,
-            "api_step": "admin_policy_list"
-        }
 
 def call_admin_policy_details(combination: Dict[str, str], policy_id: str) -> Dict[str, Any]:
     """
@@ -269,51 +206,8 @@ def call_admin_policy_details(combination: Dict[str, str], policy_id: str) -> Di
     Returns:
         Dict with standardized API response
     """
-    try:
-        logger.debug(f"Calling admin_policy_details for policy {policy_id}")
-
-        # Generate payload
-        payload = dummy_payloads.get_payload_for_step(
-            "admin_policy_details",
-            "", "", "",  # Not needed for this step
-            admin_token="admin_token_123",
-            policy_id=policy_id
-        )
+    return _call_step("admin_policy_details", combination, admin_token=ADMIN_TOKEN, policy_id=policy_id)
 
-        # Get response
-        response = dummy_responses.get_response_for_step(
-            "admin_policy_details",
-            "", "", "",  # Not needed for this step
-            policy_id=policy_id
-        )
-
-        # Validate response
-        if not response or response.get("status") != "success":
-            logger.error(f"Admin policy details failed: {response}")
-            return {
-                "success": False,
-                "error": response.get("error", "Failed to retrieve admin policy details"),
-                "status_code": response.get("status_code", 500),
-                "api_step": "admin_policy_details"
-            }
-
-        logger.info(f"Admin policy details retrieved successfully for policy {policy_id}")
-        return {
-            "success": True,
-            "data": response,
-            "policy": response,
-            "api_step": "admin_policy_details",
-            "status_code": 200
-        }
-
-    except Exception as e:
-        logger.error(f"Admin policy details error: {e}", exc_info=True)
-        return {
-            "success": False,
-            "error": f"Failed to retrieve admin policy details: {str(e)}",
-            "status_code": 500,
-            "api_step": "admin_policy_details"
-        }
 
 def call_customer_policy_list(combination: Dict[str, str]) -> Dict[str, Any]:
     """
@@ -327,50 +221,8 @@ def call_customer_policy_list(combination: Dict[str, str]) -> Dict[str, Any]:
     Returns:
         Dict with standardized API response
     """
-    try:
-        logger.debug(f"Calling customer_policy_list for {combination}")
+    return _call_step("customer_policy_list", combination, customer_token=CUSTOMER_TOKEN)
 
-        # Generate payload
-        payload = dummy_payloads.get_payload_for_step(
-            "customer_policy_list",
-            "", "", "",  # Not needed for this step
-            customer_token="customer_token_123"
-        )
-
-        # Get response
-        response = dummy_responses.get_response_for_step(
-            "customer_policy_list",
-            "", "", "",  # Not needed for this step
-            customer_token="customer_token_123"
-        )
-
-        # Validate response
-        if not response or response.get("status") != "success":
-            logger.error(f"Customer policy list failed: {response}")
-            return {
-                "success": False,
-                "error": response.get("error", "Failed to retrieve customer policy list"),
-                "status_code": response.get("status_code", 500),
-                "api_step": "customer_policy_list"
-            }
-
-        logger.info(f"Customer policy list retrieved successfully: {len(response.get('policies', []))} policies")
-        return {
-            "success": True,
-            "data": response,
-            "policies": response.get("policies", []),
-            "api_step": "customer_policy_list",
-            "status_code": 200
-        }
-
-    except Exception as e:
-        logger.error(f"Customer policy list error: {e}", exc_info=True)
-        return {
-            "success": False,
-            "error": f"Failed to retrieve customer policy list: {str(e)}",
-            "status_code": 500,
-            "api_step": "customer_policy_list"
-        }
 
 def call_customer_policy_details(combination: Dict[str, str], policy_id: str) -> Dict[str, Any]:
     """
@@ -385,48 +237,4 @@ def call_customer_policy_details(combination: Dict[str, str], policy_id: str) ->
     Returns:
         Dict with standardized API response
     """
-    try:
-        logger.debug(f"Calling customer_policy_details for policy {policy_id}")
-
-        # Generate payload
-        payload = dummy_payloads.get_payload_for_step(
-            "customer_policy_details",
-            "", "", "",  # Not needed for this step
-            customer_token="customer_token_123",
-            policy_id=policy_id
-        )
-
-        # Get response
-        response = dummy_responses.get_response_for_step(
-            "customer_policy_details",
-            "", "", "",  # Not needed for this step
-            policy_id=policy_id
-        )
-
-        # Validate response
-        if not response or response.get("status") != "success":
-            logger.error(f"Customer policy details failed: {response}")
-            return {
-                "success": False,
-                "error": response.get("error", "Failed to retrieve customer policy details"),
-                "status_code": response.get("status_code", 500),
-                "api_step": "customer_policy_details"
-            }
-
-        logger.info(f"Customer policy details retrieved successfully for policy {policy_id}")
-        return {
-            "success": True,
-            "data": response,
-            "policy": response,
-            "api_step": "customer_policy_details",
-            "status_code": 200
-        }
-
-    except Exception as e:
-        logger.error(f"Customer policy details error: {e}", exc_info=True)
-        return {
-            "success": False,
-            "error": f"Failed to retrieve customer policy details: {str(e)}",
-            "status_code": 500,
-            "api_step": "customer_policy_details"
-        }
\ No newline at end of file
+    return _call_step("customer_policy_details", combination, customer_token=CUSTOMER_TOKEN, policy_id=policy_id)
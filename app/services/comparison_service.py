@@ -4,9 +4,14 @@ Compares Target (DEV/QA) vs Staging environment responses using deepdiff.
 Implements intelligent comparison rules from PRD (ignore timestamps, metadata).
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 import logging
+import re
+
+import orjson
 
 # Temporarily disable deepdiff to avoid comparison issues
 # try:
@@ -23,6 +28,9 @@ from app.utils import response_normalizer
 
 logger = logging.getLogger(__name__)
 
+# Distinguishes a missing key from a key whose value is None
+_MISSING = object()
+
 
 class ComparisonService:
     """Service for comparing API responses across environments."""
@@ -36,6 +44,12 @@ class ComparisonService:
             "status",
             "sum_insured"
         ]
+        # Any critical term anywhere in the lowercased field path
+        self._critical_pattern = re.compile(
+            "|".join(re.escape(field.lower()) for field in self.critical_fields)
+        )
+        # Field paths repeat across steps and environments
+        self._classify_field = lru_cache(maxsize=2048)(self._classify_field_uncached)
 
     def compare_responses(
         self,
@@ -44,7 +58,8 @@ class ComparisonService:
         target_response: Dict[str, Any],
         staging_response: Dict[str, Any],
         target_environment: str = "DEV",
-        staging_environment: str = "STAGING"
+        staging_environment: str = "STAGING",
+        timestamp: Optional[datetime] = None
     ) -> Comparison:
         """
         Compare target and staging responses.
@@ -56,6 +71,7 @@ class ComparisonService:
             staging_response: Response from staging environment
             target_environment: Target environment name
             staging_environment: Staging environment name
+            timestamp: Comparison time; defaults to now
 
         Returns:
             Comparison model with differences and summary
@@ -80,10 +96,10 @@ class ComparisonService:
 
             summary = self._generate_summary(differences)
 
-            comparison = Comparison(
+            comparison = Comparison.model_construct(
                 comparison_id=comparison_id,
                 execution_id=execution_id,
-                timestamp=datetime.now(),
+                timestamp=timestamp or datetime.now(),
                 api_step=api_step,
                 target_environment=target_environment,
                 staging_environment=staging_environment,
@@ -94,15 +110,16 @@ class ComparisonService:
             )
 
             logger.info(
-                f"Comparison completed for {api_step}: "
-                f"{summary.get('total', 0)} differences "
-                f"({summary.get('critical', 0)} critical)"
+                "Comparison completed for %s: %s differences (%s critical)",
+                api_step,
+                summary.get('total', 0),
+                summary.get('critical', 0)
             )
 
             return comparison
 
         except Exception as e:
-            logger.error(f"Failed to compare responses for {api_step}: {e}", exc_info=True)
+            logger.error("Failed to compare responses for %s: %s", api_step, e, exc_info=True)
             raise
 
     def compare_api_calls(
@@ -126,7 +143,7 @@ class ComparisonService:
 
         if target_call.api_step != staging_call.api_step:
             logger.warning(
-                f"API steps don't match: {target_call.api_step} vs {staging_call.api_step}"
+                "API steps don't match: %s vs %s", target_call.api_step, staging_call.api_step
             )
             return comparisons
 
@@ -143,6 +160,44 @@ class ComparisonService:
 
         return comparisons
 
+    def compare_many(
+        self,
+        execution_id: str,
+        call_pairs: Sequence[Tuple[Any, Any]]
+    ) -> List[Comparison]:
+        """
+        Compare several target/staging API call pairs in one batch.
+
+        Args:
+            execution_id: Execution identifier
+            call_pairs: (target_call, staging_call) pairs, one per API step
+
+        Returns:
+            List of Comparison models, in the order of call_pairs. Pairs whose
+            API steps don't match are skipped. All share one timestamp.
+        """
+        comparisons = []
+        timestamp = datetime.now()
+
+        for target_call, staging_call in call_pairs:
+            if target_call.api_step != staging_call.api_step:
+                logger.warning(
+                    "API steps don't match: %s vs %s", target_call.api_step, staging_call.api_step
+                )
+                continue
+
+            comparisons.append(self.compare_responses(
+                execution_id=execution_id,
+                api_step=target_call.api_step,
+                target_response=target_call.response_data,
+                staging_response=staging_call.response_data,
+                target_environment=target_call.environment,
+                staging_environment=staging_call.environment,
+                timestamp=timestamp
+            ))
+
+        return comparisons
+
     def _find_differences(
         self,
         response1: Dict[str, Any],
@@ -226,7 +281,7 @@ class ComparisonService:
                         differences.append(difference)
 
         except Exception as e:
-            logger.error(f"DeepDiff comparison failed: {e}", exc_info=True)
+            logger.error("DeepDiff comparison failed: %s", e, exc_info=True)
             differences.extend(self._basic_compare(response1, response2, api_step))
 
         return differences
@@ -240,35 +295,68 @@ class ComparisonService:
         """Basic comparison when deepdiff is not available."""
         differences = []
 
-        all_keys = set(response1.keys()) | set(response2.keys())
+        if response1 is response2:
+            return differences
 
-        for key in all_keys:
-            if key not in response1:
-                differences.append(Difference(
-                    field_path=key,
-                    target_value=None,
-                    staging_value=response2[key],
-                    severity="info",
-                    description="Field added in staging"
-                ))
-            elif key not in response2:
-                differences.append(Difference(
+        for key, value1 in response1.items():
+            value2 = response2.get(key, _MISSING)
+
+            if value2 is _MISSING:
+                differences.append(Difference.model_construct(
                     field_path=key,
-                    target_value=response1[key],
+                    target_value=value1,
                     staging_value=None,
                     severity="info",
                     description="Field removed from staging"
                 ))
-            elif response1[key] != response2[key]:
+            elif value1 is value2:
+                # Same object on both sides (shared/cached values): nothing to compare
+                continue
+            elif value1 != value2 and not self._same_items_unordered(value1, value2):
                 differences.append(self._create_difference(
                     key,
-                    response1[key],
-                    response2[key],
+                    value1,
+                    value2,
                     api_step
                 ))
 
+        for key in response2.keys() - response1.keys():
+            differences.append(Difference.model_construct(
+                field_path=key,
+                target_value=None,
+                staging_value=response2[key],
+                severity="info",
+                description="Field added in staging"
+            ))
+
         return differences
 
+    def _same_items_unordered(self, value1: Any, value2: Any) -> bool:
+        """
+        Check whether two lists hold the same items in a different order.
+
+        List endpoints (e.g. policy lists) may return records in any order, which
+        shouldn't count as a difference.
+
+        Args:
+            value1: Value in target environment
+            value2: Value in staging environment
+
+        Returns:
+            True if both are lists with equal items regardless of order
+        """
+        if not (isinstance(value1, list) and isinstance(value2, list)) or len(value1) != len(value2):
+            return False
+
+        try:
+            return (
+                sorted(orjson.dumps(item, option=orjson.OPT_SORT_KEYS) for item in value1) ==
+                sorted(orjson.dumps(item, option=orjson.OPT_SORT_KEYS) for item in value2)
+            )
+        except TypeError:
+            # Not JSON-encodable (e.g. non-string keys): keep the ordered comparison
+            return False
+
     def _create_difference(
         self,
         field_path: str,
@@ -291,7 +379,7 @@ class ComparisonService:
         severity = self._determine_severity(field_path)
         description = self._generate_description(field_path, target_value, staging_value)
 
-        return Difference(
+        return Difference.model_construct(
             field_path=field_path,
             target_value=target_value,
             staging_value=staging_value,
@@ -309,13 +397,15 @@ class ComparisonService:
         Returns:
             Severity level (critical, warning, info)
         """
+        return self._classify_field(field_path)
+
+    def _classify_field_uncached(self, field_path: str) -> str:
         field_lower = field_path.lower()
 
-        for critical_field in self.critical_fields:
-            if critical_field.lower() in field_lower:
-                return "critical"
+        if self._critical_pattern.search(field_lower):
+            return "critical"
 
-        if "type" in field_lower or field_lower.endswith("_type"):
+        if "type" in field_lower:
             return "warning"
 
         return "info"
@@ -342,14 +432,11 @@ class ComparisonService:
         Returns:
             Dictionary with counts by severity
         """
-        summary = {
-            "critical": 0,
-            "warning": 0,
-            "info": 0,
+        counts = Counter(diff.severity for diff in differences)
+
+        return {
+            "critical": counts["critical"],
+            "warning": counts["warning"],
+            "info": counts["info"],
             "total": len(differences)
         }
-
-        for diff in differences:
-            summary[diff.severity] += 1
-
-        return summary
@@ -4,13 +4,18 @@ Provides product configuration data from config/products.json.
 Supports category, product, and plan hierarchy as defined in PRD.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
 import logging
+import threading
 
 from app.core.product_config import ProductConfigLoader
 
 logger = logging.getLogger(__name__)
 
+# Categories lists whose combinations are kept, least recently used dropped first
+_COMBINATIONS_CACHE_SIZE = 128
+
 
 class ConfigService:
     """Service for accessing product configuration."""
@@ -18,6 +23,10 @@ class ConfigService:
     def __init__(self):
         self.product_loader = ProductConfigLoader()
         self._load_config = self.product_loader.load_config
+        # Combinations per categories tuple, valid for the hierarchy object they were built from
+        self._combinations_source: Optional[Dict[str, Any]] = None
+        self._combinations_cache: "OrderedDict[Tuple[str, ...], List[Dict[str, str]]]" = OrderedDict()
+        self._combinations_lock = threading.Lock()
 
     def get_all_categories(self) -> List[str]:
         """
@@ -151,6 +160,23 @@ class ConfigService:
         """
         try:
             hierarchy = self._load_config()
+
+            cache_key = tuple(categories) if categories else ()
+
+            with self._combinations_lock:
+                # The loader returns the same dict until products.json changes
+                if hierarchy is not self._combinations_source:
+                    self._combinations_source = hierarchy
+                    self._combinations_cache.clear()
+
+                cached = self._combinations_cache.get(cache_key)
+                if cached is not None:
+                    self._combinations_cache.move_to_end(cache_key)
+
+            # Callers get their own dicts; the cached ones are never handed out
+            if cached is not None:
+                return [dict(combination) for combination in cached]
+
             combinations = []
 
             categories_to_process = (
@@ -175,7 +201,12 @@ class ConfigService:
                         })
 
             logger.info(f"Generated {len(combinations)} combinations for {len(categories_to_process)} categories")
-            return combinations
+            with self._combinations_lock:
+                if hierarchy is self._combinations_source:
+                    self._combinations_cache[cache_key] = combinations
+                    while len(self._combinations_cache) > _COMBINATIONS_CACHE_SIZE:
+                        self._combinations_cache.popitem(last=False)
+            return [dict(combination) for combination in combinations]
 
         except Exception as e:
             logger.error(f"Failed to get combinations: {e}", exc_info=True)
@@ -4,20 +4,29 @@ This module implements the core sequential execution logic that orchestrates
 the complete insurance purchase flow for each Category+Product+Plan combination.
 
 Execution Flow:
-1. execute_master() - Main orchestrator for all combinations
-2. execute_combination() - Sequential execution for one combination
-3. API calls with random delays and failure handling
+1. execute_master() - Main orchestrator, runs independent combinations
+   concurrently (execute_master_async() awaits them from the event loop)
+2. execute_combination() - Dependency-ordered execution for one combination
+3. API calls layered by dependency, each layer run concurrently, with
+   random delays and failure handling
 4. Progress saving after each step
 5. Integration with storage and logging systems
 """
 
+import asyncio
+import os
 import time
 import random
 import json
 import logging
-from typing import Dict, Any, List
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
 
+import orjson
+
 from app.services.api_functions import (
     call_application_submit,
     call_apply_coupon,
@@ -27,23 +36,128 @@ from app.services.api_functions import (
     call_customer_policy_list,
     call_customer_policy_details
 )
+from app.core.concurrency import CoalescingFileWriter
+from app.core.config import settings
+from app.models.execution import ExecutionSpec
 from app.services.config_service import ConfigService
 from app.services.storage_service import StorageService
 
 logger = logging.getLogger(__name__)
 
+# Combinations run here rather than in the loop's default executor, so a large
+# execution can't starve the asyncio.to_thread calls made by request handlers.
+# Shared across jobs: bounds total combination threads for the process.
+_combination_executor = ThreadPoolExecutor(
+    max_workers=settings.max_concurrent_combinations,
+    thread_name_prefix="combination"
+)
+
+# API calls within a combination layer (both environments, independent steps)
+# run here; shared across combinations so total call threads stay bounded.
+_api_call_executor = ThreadPoolExecutor(
+    max_workers=settings.max_concurrent_api_calls,
+    thread_name_prefix="api-call"
+)
+
+# Progress snapshots are written off the combination threads; a snapshot that
+# is superseded before it reaches disk is skipped.
+_progress_writer = CoalescingFileWriter(thread_name_prefix="progress-writer")
+
+# Steps in a layer depend only on earlier layers, so each layer's steps run
+# concurrently in both environments. Calls are listed in step order, DEV
+# before STAGING, which is the order results are recorded in and the order
+# the progress view expects.
+_FLOW_LAYERS = (
+    ("application_submit",),
+    ("apply_coupon",),
+    ("payment_checkout",),
+    ("admin_policy_list", "admin_policy_details", "customer_policy_list", "customer_policy_details")
+)
+_FLOW_LAYER_CALLS = tuple(
+    tuple((step_name, environment) for step_name in layer for environment in ("DEV", "STAGING"))
+    for layer in _FLOW_LAYERS
+)
+_FLOW_CALL_COUNT = sum(len(layer_calls) for layer_calls in _FLOW_LAYER_CALLS)
+
+# step name -> fn(combination, application_id) calling that step's API function
+_API_DISPATCH = {
+    "application_submit": lambda combination, application_id: call_application_submit(combination),
+    "apply_coupon": lambda combination, application_id: call_apply_coupon(combination, application_id or "default_app_id"),
+    "payment_checkout": lambda combination, application_id: call_payment_checkout(combination, application_id or "default_app_id"),
+    "admin_policy_list": lambda combination, application_id: call_admin_policy_list(combination),
+    "admin_policy_details": lambda combination, application_id: call_admin_policy_details(combination, "policy_12345"),
+    "customer_policy_list": lambda combination, application_id: call_customer_policy_list(combination),
+    "customer_policy_details": lambda combination, application_id: call_customer_policy_details(combination, "policy_12345")
+}
+
+# API steps in flow order, as keyed in the UI progress map
+_PROGRESS_STEPS = (
+    "application_submit",
+    "apply_coupon",
+    "payment_checkout",
+    "admin_policy_list",
+    "admin_policy_details",
+    "customer_policy_list",
+    "customer_policy_details"
+)
+_PROGRESS_STEP_INDEX = {step: index for index, step in enumerate(_PROGRESS_STEPS)}
+_PROGRESS_SUFFIX = "_progress.json"
+
+
+def _build_progress_map(api_calls: List[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Derive per-step UI statuses from a combination's recorded API calls.
+
+    The first call recorded for a step (the DEV call) decides its status. Steps
+    after the step of the first failing call can't proceed.
+
+    Args:
+        api_calls: API call results in execution order
+
+    Returns:
+        Dict of api_step -> pending/succeed/failed/can_not_proceed
+    """
+    progress_map = dict.fromkeys(_PROGRESS_STEPS, "pending")
+    failure_seen = False
+    failed_api_step = None
+
+    for call in api_calls:
+        api_step = call.get('api_step')
+        succeeded = call.get('status_code', 200) == 200
+
+        if not succeeded and not failure_seen:
+            failure_seen = True
+            failed_api_step = api_step
+
+        # Only the first call per step counts; later ones find it already set
+        if progress_map.get(api_step) == "pending":
+            progress_map[api_step] = "succeed" if succeeded else "failed"
+
+    # Mark all steps after the failure as can_not_proceed
+    if failed_api_step in _PROGRESS_STEP_INDEX:
+        for step in _PROGRESS_STEPS[_PROGRESS_STEP_INDEX[failed_api_step] + 1:]:
+            progress_map[step] = "can_not_proceed"
+
+    return progress_map
+
+
 class ExecutionEngine:
     """Sequential execution engine for insurance API testing."""
 
-    def __init__(self):
-        self.config_service = ConfigService()
-        self.storage_service = StorageService()
+    def __init__(self, config_service: ConfigService = None, storage_service: StorageService = None):
+        self.config_service = config_service or ConfigService()
+        self.storage_service = storage_service or StorageService()
+        # session_id -> {progress file name: (mtime_ns, size, progress_map)},
+        # least recently polled session first; at most PROGRESS_CACHE_MAX_SESSIONS
+        self._progress_cache: "OrderedDict[str, Dict[str, Tuple[int, int, Dict[str, str]]]]" = OrderedDict()
+        self._progress_cache_lock = threading.Lock()
 
     def execute_master(self, username: str, session_id: str, config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Master execution orchestrator.
 
-        Processes all Category+Product+Plan combinations sequentially.
+        Processes all Category+Product+Plan combinations concurrently on the
+        shared combination thread pool, blocking until all have finished.
 
         Args:
             username: User identifier for session
@@ -54,67 +168,75 @@ class ExecutionEngine:
             Dict with execution results summary
         """
         try:
-            logger.info(f"[EXEC-MASTER] Starting master execution for user {username}, session {session_id}")
+            session_dir, combinations = self._prepare_master(username, session_id, config)
 
-            # Use the provided session_id for directory creation
-            session_dir = self.storage_service.create_session_directory(session_id)
+            if not combinations:
+                return self._no_combinations_result()
 
-            logger.info(f"[EXEC-MASTER] Created session directory: {session_dir}")
+            # Combinations are independent; results keep combination order
+            execution_results = list(_combination_executor.map(
+                lambda indexed: self._run_combination(
+                    username, session_dir, indexed[1], config, indexed[0], len(combinations)
+                ),
+                enumerate(combinations, 1)
+            ))
 
-            # Generate combinations from config
-            combinations = self.config_service.get_all_combinations(
-                config.get("categories", [])
-            )
+            return self._summarize_master(session_id, execution_results)
 
-            if not combinations:
-                logger.warning("[EXEC-MASTER] No combinations generated from config")
-                return {
-                    "success": False,
-                    "error": "No combinations found for the selected categories",
-                    "executions": []
-                }
+        except Exception as e:
+            logger.error(f"[EXEC-MASTER] Master execution failed: {e}", exc_info=True)
+            return {
+                "success": False,
+                "error": f"Master execution failed: {str(e)}",
+                "executions": []
+            }
 
-            logger.info(f"[EXEC-MASTER] Generated {len(combinations)} combinations")
+    async def execute_master_async(self, username: str, session_id: str, config: Dict[str, Any],
+                                   max_concurrency: int = 8,
+                                   specs: Optional[List[ExecutionSpec]] = None) -> Dict[str, Any]:
+        """
+        Async variant of execute_master().
 
-            # Execute each combination sequentially
-            execution_results = []
+        Combinations are independent, so each one runs on the shared combination
+        thread pool with at most max_concurrency from this job running at once.
+        Within a combination, dependent steps stay ordered while the DEV and
+        STAGING calls of each step layer run together.
 
-            for i, combination in enumerate(combinations, 1):
-                logger.info(f"[EXEC-MASTER] Executing combination {i}/{len(combinations)}: {combination}")
+        Args:
+            username: User identifier for session
+            session_id: Session identifier (format: username_date_timestamp)
+            config: Configuration with categories, environment, tokens
+            max_concurrency: Maximum combinations executing at the same time
+            specs: Combinations already resolved by the caller; generated from
+                config when omitted
 
-                try:
-                    result = self.execute_combination(username, session_dir, combination, config)
-                    execution_results.append(result)
+        Returns:
+            Dict with execution results summary
+        """
+        try:
+            session_dir, combinations = await asyncio.to_thread(
+                self._prepare_master, username, session_id, config, specs
+            )
 
-                    # Check if this execution failed and log appropriately
-                    if not result.get("success", False):
-                        logger.warning(f"[EXEC-MASTER] Combination {combination} failed: {result.get('error')}")
+            if not combinations:
+                return self._no_combinations_result()
 
-                    # Continue to next combination even if this one failed
-                    logger.info(f"[EXEC-MASTER] Completed combination {i}/{len(combinations)}")
+            semaphore = asyncio.Semaphore(max_concurrency)
 
-                except Exception as e:
-                    logger.error(f"[EXEC-MASTER] Unexpected error in combination {combination}: {e}")
-                    execution_results.append({
-                        "success": False,
-                        "error": f"Unexpected error: {str(e)}",
-                        "combination": combination
-                    })
+            loop = asyncio.get_running_loop()
 
-            # Calculate summary
-            successful = sum(1 for r in execution_results if r.get("success"))
-            total = len(execution_results)
+            async def run(i: int, combination: Dict[str, str]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await loop.run_in_executor(
+                        _combination_executor,
+                        self._run_combination, username, session_dir, combination, config, i, len(combinations)
+                    )
 
-            logger.info(f"[EXEC-MASTER] Master execution completed: {successful}/{total} combinations successful")
+            execution_results = await asyncio.gather(
+                *(run(i, combination) for i, combination in enumerate(combinations, 1))
+            )
 
-            return {
-                "success": True,
-                "session_id": session_id,
-                "total_combinations": total,
-                "successful_combinations": successful,
-                "failed_combinations": total - successful,
-                "executions": execution_results
-            }
+            return self._summarize_master(session_id, list(execution_results))
 
         except Exception as e:
             logger.error(f"[EXEC-MASTER] Master execution failed: {e}", exc_info=True)
@@ -124,12 +246,85 @@ class ExecutionEngine:
                 "executions": []
             }
 
+    def _prepare_master(self, username: str, session_id: str, config: Dict[str, Any],
+                        specs: Optional[List[ExecutionSpec]] = None) -> Tuple[Path, List[Dict[str, str]]]:
+        """Create the session directory and resolve combinations from specs or config."""
+        logger.info(f"[EXEC-MASTER] Starting master execution for user {username}, session {session_id}")
+
+        # Use the provided session_id for directory creation
+        session_dir = self.storage_service.create_session_directory(session_id)
+
+        logger.info(f"[EXEC-MASTER] Created session directory: {session_dir}")
+
+        if specs is not None:
+            combinations = [spec.combination for spec in specs]
+        else:
+            # Generate combinations from config
+            combinations = self.config_service.get_all_combinations(
+                config.get("categories", [])
+            )
+
+        if combinations:
+            logger.info(f"[EXEC-MASTER] Generated {len(combinations)} combinations")
+        else:
+            logger.warning("[EXEC-MASTER] No combinations generated from config")
+
+        return session_dir, combinations
+
+    def _no_combinations_result(self) -> Dict[str, Any]:
+        """Result returned when config yields no combinations."""
+        return {
+            "success": False,
+            "error": "No combinations found for the selected categories",
+            "executions": []
+        }
+
+    def _run_combination(self, username: str, session_dir: Path, combination: Dict[str, str],
+                         config: Dict[str, Any], index: int, total: int) -> Dict[str, Any]:
+        """Execute one combination, converting unexpected errors into a failed result."""
+        logger.info(f"[EXEC-MASTER] Executing combination {index}/{total}: {combination}")
+
+        try:
+            result = self.execute_combination(username, session_dir, combination, config)
+
+            # Check if this execution failed and log appropriately
+            if not result.get("success", False):
+                logger.warning(f"[EXEC-MASTER] Combination {combination} failed: {result.get('error')}")
+
+            # Continue to next combination even if this one failed
+            logger.info(f"[EXEC-MASTER] Completed combination {index}/{total}")
+            return result
+
+        except Exception as e:
+            logger.error(f"[EXEC-MASTER] Unexpected error in combination {combination}: {e}")
+            return {
+                "success": False,
+                "error": f"Unexpected error: {str(e)}",
+                "combination": combination
+            }
+
+    def _summarize_master(self, session_id: str, execution_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the master execution summary from per-combination results."""
+        successful = sum(1 for r in execution_results if r.get("success"))
+        total = len(execution_results)
+
+        logger.info(f"[EXEC-MASTER] Master execution completed: {successful}/{total} combinations successful")
+
+        return {
+            "success": True,
+            "session_id": session_id,
+            "total_combinations": total,
+            "successful_combinations": successful,
+            "failed_combinations": total - successful,
+            "executions": execution_results
+        }
+
     def execute_combination(self, username: str, session_dir: Path,
                           combination: Dict[str, str], config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a single Category+Product+Plan combination.
 
-        Performs 14 API calls sequentially (7 DEV + 7 STAGING) with delays and failure handling.
+        Performs 14 API calls (7 DEV + 7 STAGING) in dependency layers with delays and failure handling.
 
         Args:
             username: User identifier
@@ -143,8 +338,12 @@ class ExecutionEngine:
         try:
             logger.info(f"[EXEC-COMB] Starting execution for {combination}")
 
+            # Names and paths used throughout the run, built once
+            created_at = time.time()
             combination_key = f"{combination['category']}_{combination['product_id']}_{combination['plan_id']}"
-            execution_id = f"{username}_{time.strftime('%Y%m%d_%H%M%S')}_{combination_key}"
+            execution_id = f"{username}_{time.strftime('%Y%m%d_%H%M%S', time.localtime(created_at))}_{combination_key}"
+            progress_file = session_dir / f"{combination_key}{_PROGRESS_SUFFIX}"
+            final_file = session_dir / f"{combination_key}_complete.json"
 
             # Initialize execution data
             execution_data = {
@@ -160,94 +359,77 @@ class ExecutionEngine:
                 "comparisons": [],
                 "reports": {},
                 "has_failures": False,
-                "created_at": time.time()
+                "created_at": created_at
             }
 
             # Save initial progress
-            self._save_progress(session_dir, combination, execution_data)
+            self._save_progress(progress_file, execution_data)
 
             # Track API call results
             api_results = []
             application_id = None
             execution_stopped = False
 
-            # Define API call sequence
-            api_steps = [
-                ("application_submit", "DEV"),
-                ("application_submit", "STAGING"),
-                ("apply_coupon", "DEV"),
-                ("apply_coupon", "STAGING"),
-                ("payment_checkout", "DEV"),
-                ("payment_checkout", "STAGING"),
-                ("admin_policy_list", "DEV"),
-                ("admin_policy_list", "STAGING"),
-                ("admin_policy_details", "DEV"),
-                ("admin_policy_details", "STAGING"),
-                ("customer_policy_list", "DEV"),
-                ("customer_policy_list", "STAGING"),
-                ("customer_policy_details", "DEV"),
-                ("customer_policy_details", "STAGING")
-            ]
-
-            logger.info(f"[EXEC-COMB] Starting {len(api_steps)} API calls for {combination_key}")
-
-            # Execute API calls sequentially
-            for step_name, environment in api_steps:
+            logger.info(f"[EXEC-COMB] Starting {_FLOW_CALL_COUNT} API calls for {combination_key}")
+
+            for layer_index, layer_calls in enumerate(_FLOW_LAYER_CALLS):
                 if execution_stopped:
-                    logger.info(f"[EXEC-COMB] Skipping {step_name} ({environment}) - execution stopped")
-                    # Still record as skipped for progress tracking
-                    skipped_result = {
-                        "success": False,
-                        "error": "Execution stopped due to previous failure",
-                        "api_step": step_name,
-                        "environment": environment,
-                        "status_code": 0
-                    }
-                    api_results.append(skipped_result)
+                    for step_name, environment in layer_calls:
+                        logger.info(f"[EXEC-COMB] Skipping {step_name} ({environment}) - execution stopped")
+                        # Still record as skipped for progress tracking
+                        api_results.append({
+                            "success": False,
+                            "error": "Execution stopped due to previous failure",
+                            "api_step": step_name,
+                            "environment": environment,
+                            "status_code": 0
+                        })
                     continue
 
-                logger.debug(f"[EXEC-COMB] Executing {step_name} in {environment}")
+                logger.debug(f"[EXEC-COMB] Executing {_FLOW_LAYERS[layer_index]} in DEV and STAGING")
+
+                layer_application_id = application_id
+                layer_results = _api_call_executor.map(
+                    lambda call: self._call_api_function(call[0], combination, layer_application_id, config),
+                    layer_calls
+                )
+
+                for (step_name, environment), result in zip(layer_calls, layer_results):
+                    # Add environment to result for progress tracking
+                    if isinstance(result, dict):
+                        result["environment"] = environment
+
+                    # Store result
+                    api_results.append(result)
 
-                # Call appropriate API function
-                result = self._call_api_function(step_name, combination, application_id, config)
+                    # Check for failures
+                    if not result.get("success", False):
+                        logger.warning(f"[EXEC-COMB] API call failed: {step_name} ({environment}) - {result.get('error')}")
+
+                        # Special handling for payment_checkout failure - stop execution
+                        if step_name == "payment_checkout" and environment == "DEV":
+                            if combination["category"] == "MV4" and combination["product_id"] == "TOKIO_MARINE" and combination["plan_id"] == "COMPREHENSIVE":
+                                logger.info(f"[EXEC-COMB] Payment checkout failed for failing combination - stopping execution")
+                                execution_stopped = True
+                                execution_data["has_failures"] = True
+                            else:
+                                logger.warning(f"[EXEC-COMB] Payment checkout failed but continuing (not the failing combination)")
 
-                # Add environment to result for progress tracking
-                if isinstance(result, dict):
-                    result["environment"] = environment
+                        execution_data["has_failures"] = True
 
-                # Store result
-                api_results.append(result)
+                    # Extract application_id from successful application_submit
+                    if step_name == "application_submit" and result.get("success") and environment == "DEV":
+                        application_id = result.get("application_id")
+                        logger.debug(f"[EXEC-COMB] Extracted application_id: {application_id}")
 
-                # Update execution data
+                # Update execution data and save progress after each layer
                 execution_data["api_calls"] = api_results
+                self._save_progress(progress_file, execution_data)
 
-                # Check for failures
-                if not result.get("success", False):
-                    logger.warning(f"[EXEC-COMB] API call failed: {step_name} ({environment}) - {result.get('error')}")
-
-                    # Special handling for payment_checkout failure - stop execution
-                    if step_name == "payment_checkout" and environment == "DEV":
-                        if combination["category"] == "MV4" and combination["product_id"] == "TOKIO_MARINE" and combination["plan_id"] == "COMPREHENSIVE":
-                            logger.info(f"[EXEC-COMB] Payment checkout failed for failing combination - stopping execution")
-                            execution_stopped = True
-                            execution_data["has_failures"] = True
-                        else:
-                            logger.warning(f"[EXEC-COMB] Payment checkout failed but continuing (not the failing combination)")
-
-                    execution_data["has_failures"] = True
-
-                # Extract application_id from successful application_submit
-                if step_name == "application_submit" and result.get("success") and environment == "DEV":
-                    application_id = result.get("application_id")
-                    logger.debug(f"[EXEC-COMB] Extracted application_id: {application_id}")
-
-                # Save progress after each API call
-                self._save_progress(session_dir, combination, execution_data)
-
-                # Add random delay between calls (except for the last call in each pair)
-                if not (step_name == "customer_policy_details" and environment == "STAGING"):
-                    delay = random.randint(1, 3)
-                    logger.debug(f"[EXEC-COMB] Adding {delay}s delay before next API call")
+                # Add random delay between layers (except after the last one)
+                if layer_index < len(_FLOW_LAYER_CALLS) - 1 and not execution_stopped and settings.api_layer_delay_max_seconds > 0:
+                    delay = random.randint(settings.api_layer_delay_min_seconds, settings.api_layer_delay_max_seconds)
+                    logger.debug(f"[EXEC-COMB] Adding {delay}s delay before next API layer")
                     time.sleep(delay)
 
             # Finalize execution
@@ -257,7 +439,7 @@ class ExecutionEngine:
             execution_data["successful_api_calls"] = sum(1 for r in api_results if r.get("success"))
 
             # Save final results
-            self._save_final_results(session_dir, combination, execution_data)
+            self._save_final_results(final_file, execution_data)
 
             logger.info(f"[EXEC-COMB] Completed execution for {combination_key}: {execution_data['successful_api_calls']}/{execution_data['total_api_calls']} API calls successful")
 
@@ -294,20 +476,9 @@ class ExecutionEngine:
             API call result
         """
         try:
-            if step_name == "application_submit":
-                return call_application_submit(combination)
-            elif step_name == "apply_coupon":
-                return call_apply_coupon(combination, application_id or "default_app_id")
-            elif step_name == "payment_checkout":
-                return call_payment_checkout(combination, application_id or "default_app_id")
-            elif step_name == "admin_policy_list":
-                return call_admin_policy_list(combination)
-            elif step_name == "admin_policy_details":
-                return call_admin_policy_details(combination, "policy_12345")
-            elif step_name == "customer_policy_list":
-                return call_customer_policy_list(combination)
-            elif step_name == "customer_policy_details":
-                return call_customer_policy_details(combination, "policy_12345")
+            api_function = _API_DISPATCH.get(step_name)
+            if api_function:
+                return api_function(combination, application_id)
             else:
                 return {
                     "success": False,
@@ -325,31 +496,33 @@ class ExecutionEngine:
                 "status_code": 500
             }
 
-    def _save_progress(self, session_dir: Path, combination: Dict[str, str], execution_data: Dict[str, Any]):
-        """Save current execution progress to JSON file."""
-        try:
-            combination_key = f"{combination['category']}_{combination['product_id']}_{combination['plan_id']}"
-            progress_file = session_dir / f"{combination_key}_progress.json"
+    def _save_progress(self, progress_file: Path, execution_data: Dict[str, Any]):
+        """
+        Queue the current execution progress for writing to its JSON file.
 
-            with open(progress_file, 'w') as f:
-                import json
-                json.dump(execution_data, f, indent=2, default=str)
+        The snapshot is serialized here, so later changes to execution_data
+        don't leak into it; the write itself happens on the progress writer.
+        """
+        try:
+            _progress_writer.submit(
+                progress_file,
+                orjson.dumps(execution_data, default=str, option=orjson.OPT_NON_STR_KEYS)
+            )
 
-            logger.debug(f"[EXEC-SAVE] Saved progress for {combination_key}")
+            logger.debug(f"[EXEC-SAVE] Queued progress to {progress_file.name}")
 
         except Exception as e:
             logger.error(f"[EXEC-SAVE] Failed to save progress: {e}")
 
-    def _save_final_results(self, session_dir: Path, combination: Dict[str, str], execution_data: Dict[str, Any]):
+    def _save_final_results(self, final_file: Path, execution_data: Dict[str, Any]):
         """Save final execution results to JSON file."""
         try:
-            combination_key = f"{combination['category']}_{combination['product_id']}_{combination['plan_id']}"
-            final_file = session_dir / f"{combination_key}_complete.json"
+            # Progress snapshots land before the combination is reported done
+            _progress_writer.flush()
 
-            with open(final_file, 'w') as f:
-                json.dump(execution_data, f, indent=2, default=str)
+            final_file.write_bytes(orjson.dumps(execution_data, default=str, option=orjson.OPT_NON_STR_KEYS))
 
-            logger.info(f"[EXEC-SAVE] Saved final results for {combination_key}")
+            logger.info(f"[EXEC-SAVE] Saved final results to {final_file.name}")
 
         except Exception as e:
             logger.error(f"[EXEC-SAVE] Failed to save final results: {e}")
@@ -368,118 +541,9 @@ class ExecutionEngine:
             Dict with session_id and executions progress data
         """
         try:
-            logger.debug(f"[PROGRESS] Getting progress for session {session_id}")
-
-            # Find session directory
-            session_dir = self.storage_service.create_session_directory(session_id)
-
-            executions_progress = {}
-            progress_files_found = 0
-
-            # Read all progress files in session directory
-            if session_dir.exists():
-                for progress_file in session_dir.glob("*_progress.json"):
-                    try:
-                        progress_files_found += 1
-
-                        # Extract combination from filename
-                        # Format: {category}_{product}_{plan}_progress.json
-                        filename = progress_file.stem  # Remove .json extension
-                        combination_key = filename.replace('_progress', '')
-
-                        # Read progress data
-                        with open(progress_file, 'r') as f:
-                            execution_data = json.load(f)
-
-                        # Extract API call statuses for progress
-                        api_calls = execution_data.get("api_calls", [])
-
-                        # Build progress map for UI
-                        progress_map = {}
-
-                        # Get all possible API steps (UI-expected keys without _call suffix)
-                        all_steps = [
-                            "application_submit",
-                            "apply_coupon",
-                            "payment_checkout",
-                            "admin_policy_list",
-                            "admin_policy_details",
-                            "customer_policy_list",
-                            "customer_policy_details"
-                        ]
-
-                        # Initialize all steps as "pending"
-                        for step in all_steps:
-                            progress_map[step] = "pending"
-
-                        # Find the last failed call to determine stopping point
-                        failed_step_index = None
-                        for i, call in enumerate(api_calls):
-                            if call.get('status_code', 200) != 200:
-                                failed_step_index = i
-                                break
-
-                        # Map API calls to progress steps (UI-expected keys)
-                        step_mapping = {
-                            "application_submit": "application_submit",
-                            "apply_coupon": "apply_coupon",
-                            "payment_checkout": "payment_checkout",
-                            "admin_policy_list": "admin_policy_list",
-                            "admin_policy_details": "admin_policy_details",
-                            "customer_policy_list": "customer_policy_list",
-                            "customer_policy_details": "customer_policy_details"
-                        }
-
-                        # Update progress based on API calls (use first call per step for DEV environment)
-                        dev_calls = {}
-                        for call in api_calls:
-                            api_step = call.get('api_step')
-                            status_code = call.get('status_code', 200)
-
-                            # Since environment field may be missing, use the first call for each step
-                            if api_step and api_step not in dev_calls:
-                                dev_calls[api_step] = call
-
-                        for api_step, call in dev_calls.items():
-                            status_code = call.get('status_code', 200)
-                            if api_step in step_mapping:
-                                ui_step = step_mapping[api_step]
-
-                                if status_code == 200:
-                                    progress_map[ui_step] = "succeed"
-                                else:
-                                    progress_map[ui_step] = "failed"
-
-                        # Mark steps after failure as "can_not_proceed"
-                        if failed_step_index is not None:
-                            # Find which step failed
-                            failed_call = api_calls[failed_step_index]
-                            failed_api_step = failed_call.get('api_step')
-
-                            if failed_api_step in step_mapping:
-                                failed_ui_step = step_mapping[failed_api_step]
-                                failed_index = all_steps.index(failed_ui_step)
-
-                                # Mark all subsequent steps as can_not_proceed
-                                for i in range(failed_index + 1, len(all_steps)):
-                                    progress_map[all_steps[i]] = "can_not_proceed"
-
-                        # Generate execution ID for UI
-                        execution_id = f"{username}_{session_id}_{combination_key}"
-
-                        executions_progress[execution_id] = progress_map
-
-                        logger.debug(f"[PROGRESS] Loaded progress for {combination_key}: {progress_map}")
-
-                    except Exception as e:
-                        logger.error(f"[PROGRESS] Failed to read progress file {progress_file}: {e}")
-                        continue
-
-            logger.info(f"[PROGRESS] Found {progress_files_found} progress files, returned {len(executions_progress)} execution progress entries")
-
             return {
                 "session_id": session_id,
-                "executions": executions_progress
+                "executions": dict(self.iter_session_progress(username, session_id))
             }
 
         except Exception as e:
@@ -487,4 +551,116 @@ class ExecutionEngine:
             return {
                 "session_id": session_id,
                 "executions": {}
-            }
\ No newline at end of file
+            }
+
+    def get_session_progress_version(self, session_id: str) -> str:
+        """
+        Cheap fingerprint of a session's progress files for conditional polling.
+
+        Only directory entries are stat'ed; no progress file is opened.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            "{file_count}-{latest_mtime_ns}", "0-0" when there are no files yet
+        """
+        session_dir = self.storage_service.executions_dir / session_id
+        file_count = 0
+        latest_mtime_ns = 0
+
+        try:
+            with os.scandir(session_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(_PROGRESS_SUFFIX):
+                        file_count += 1
+                        latest_mtime_ns = max(latest_mtime_ns, entry.stat().st_mtime_ns)
+        except FileNotFoundError:
+            pass
+
+        return f"{file_count}-{latest_mtime_ns}"
+
+    def iter_session_progress(self, username: str, session_id: str) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """
+        Yield progress for each execution in a session, one progress file at a time.
+
+        Args:
+            username: User identifier
+            session_id: Session identifier
+
+        Yields:
+            Tuples of (execution_id, {api_step: status})
+        """
+        logger.debug(f"[PROGRESS] Getting progress for session {session_id}")
+
+        # Find session directory
+        session_dir = self.storage_service.create_session_directory(session_id)
+
+        progress_files_found = 0
+        entries_returned = 0
+
+        # Read all progress files in session directory
+        try:
+            with os.scandir(session_dir) as entries:
+                progress_entries = [entry for entry in entries if entry.name.endswith(_PROGRESS_SUFFIX)]
+        except FileNotFoundError:
+            progress_entries = []
+
+        # Progress maps from the previous poll; files whose mtime and size are
+        # unchanged are not re-read. Rebuilt each poll so removed files drop out.
+        with self._progress_cache_lock:
+            cached_maps = self._progress_cache.get(session_id, {})
+        current_maps = {}
+
+        for progress_file in progress_entries:
+            try:
+                progress_files_found += 1
+
+                # Extract combination from filename
+                # Format: {category}_{product}_{plan}_progress.json
+                combination_key = progress_file.name[:-len(_PROGRESS_SUFFIX)]
+
+                stat = progress_file.stat()
+                cached = cached_maps.get(progress_file.name)
+
+                if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    progress_map = cached[2]
+                else:
+                    # Read progress data
+                    with open(progress_file.path, 'rb') as f:
+                        raw = f.read()
+                    try:
+                        execution_data = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        # Files written by json.dump may hold NaN, which orjson rejects
+                        execution_data = json.loads(raw)
+
+                    # Extract API call statuses for progress
+                    api_calls = execution_data.get("api_calls", [])
+
+                    progress_map = _build_progress_map(api_calls)
+
+                    logger.debug(f"[PROGRESS] Loaded progress for {combination_key}: {progress_map}")
+
+                current_maps[progress_file.name] = (stat.st_mtime_ns, stat.st_size, progress_map)
+
+                # Generate execution ID for UI
+                execution_id = f"{username}_{session_id}_{combination_key}"
+
+            except Exception as e:
+                logger.error(f"[PROGRESS] Failed to read progress file {progress_file.path}: {e}")
+                continue
+
+            entries_returned += 1
+            yield execution_id, dict(progress_map)
+
+        with self._progress_cache_lock:
+            if current_maps and settings.progress_cache_max_sessions > 0:
+                self._progress_cache[session_id] = current_maps
+                self._progress_cache.move_to_end(session_id)
+                while len(self._progress_cache) > settings.progress_cache_max_sessions:
+                    self._progress_cache.popitem(last=False)
+            else:
+                self._progress_cache.pop(session_id, None)
+
+        logger.info(f"[PROGRESS] Found {progress_files_found} progress files, returned {entries_returned} execution progress entries")
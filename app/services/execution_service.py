@@ -4,7 +4,7 @@ Orchestrates test execution across all Category+Product+Plan combinations.
 Implements sequential execution flow as per PRD requirements.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from datetime import datetime
 import logging
 
@@ -14,8 +14,9 @@ from app.services.config_service import ConfigService
 from app.services.api_executor import APIExecutorService
 from app.services.comparison_service import ComparisonService
 from app.services.llm_reporter import LLMReporterService
-from app.schemas.execution import ExecutionStartRequest, ExecutionStatusResponse, TabsListResponse, TabProgressResponse
+from app.schemas.execution import ExecutionStartRequest, ExecutionStatusResponse, TabStatus, TabsListResponse, TabProgressResponse
 from app.models.execution import Execution
+from app.models.session import ParsedSessionId
 
 logger = logging.getLogger("InternalTestingPortal")
 
@@ -38,6 +39,18 @@ class ExecutionService:
         self.api_executor = api_executor or APIExecutorService()
         self.comparison_service = comparison_service or ComparisonService()
         self.reporter = llm_reporter or LLMReporterService()
+        self._engine = None
+
+    @property
+    def engine(self):
+        """ExecutionEngine sharing this service's config and storage, built on first use."""
+        if self._engine is None:
+            from app.services.execution_engine import ExecutionEngine
+            self._engine = ExecutionEngine(
+                config_service=self.config_service,
+                storage_service=self.storage
+            )
+        return self._engine
 
     def start_execution(self, request: ExecutionStartRequest) -> List[str]:
         """
@@ -494,43 +507,27 @@ class ExecutionService:
         logger.info(f"[COMPARE] {target_env} calls: {len(target_calls)}")
         logger.info(f"[COMPARE] STAGING calls: {len(staging_calls)}")
 
-        for target_call in target_calls:
-            logger.info(f"[COMPARE] Comparing {target_env} call: {target_call.api_step}")
-            staging_call = self._find_matching_call(
-                target_call,
-                staging_calls
-            )
+        # First STAGING call per step, matched to target calls in one lookup
+        staging_by_step = {}
+        for call in staging_calls:
+            staging_by_step.setdefault(call.api_step, call)
 
+        call_pairs = []
+        for target_call in target_calls:
+            staging_call = staging_by_step.get(target_call.api_step)
             if staging_call:
-                logger.info(f"[COMPARE] Found matching STAGING call for: {target_call.api_step}")
-                comparison = self.comparison_service.compare_api_calls(
-                    execution_id=execution_id,
-                    target_call=target_call,
-                    staging_call=staging_call
-                )
-                comparisons.append(
-                    comparison[0].dict() if hasattr(comparison[0], 'dict') else comparison[0]
-                )
-                logger.info(f"[COMPARE] Added comparison for: {target_call.api_step}")
+                call_pairs.append((target_call, staging_call))
             else:
                 logger.warning(f"[COMPARE] No matching STAGING call found for: {target_call.api_step}")
 
+        for comparison in self.comparison_service.compare_many(execution_id, call_pairs):
+            comparisons.append(comparison.dict())
+
         logger.info(f"[COMPARE] Total comparisons generated: {len(comparisons)}")
         logger.info(f"[COMPARE] ===========================================")
 
         return comparisons
 
-    def _find_matching_call(
-        self,
-        target_call: Any,  # APICall object
-        calls: List[Any]   # List of APICall objects
-    ) -> Optional[Any]:
-        """Find matching API call by step name."""
-        for call in calls:
-            if call.api_step == target_call.api_step:
-                return call
-        return None
-
     def _update_execution_progress(
         self,
         execution_id: str,
@@ -618,11 +615,9 @@ class ExecutionService:
             raise ValueError(f"Session not found: {session_id}")
 
         # Use ExecutionEngine to get status from session directory
-        from app.services.execution_engine import ExecutionEngine
-        engine = ExecutionEngine()
+        engine = self.engine
 
-        # Extract username from session_id (format: username_date_timestamp)
-        username = session_id.split('_')[0]
+        username = ParsedSessionId.parse(session_id).username
 
         try:
             # Get progress data to determine status
@@ -675,7 +670,8 @@ class ExecutionService:
             in_progress_executions = 1
             overall_status = "in_progress"
 
-        return ExecutionStatusResponse(
+        # Counts computed above from trusted progress data; skip validation
+        return ExecutionStatusResponse.model_construct(
             session_id=session_id,
             overall_status=overall_status,
             total_executions=total_executions,
@@ -694,32 +690,52 @@ class ExecutionService:
         Returns:
             List of tabs with status
         """
+        # Tab dicts are built by _generate_execution_tabs; skip validation
+        return TabsListResponse.model_construct(
+            session_id=session_id,
+            tabs=[TabStatus.model_construct(**tab) for tab in self.iter_execution_tabs(session_id)]
+        )
+
+    def iter_execution_tabs(self, session_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate execution tabs for a session without materializing the full list.
+
+        The session is validated eagerly so a missing session raises before
+        any tab is produced.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Iterator of tab dicts
+
+        Raises:
+            ValueError: If session not found
+        """
         session = self.session_service.get_session(session_id)
 
         if not session:
             raise ValueError(f"Session not found: {session_id}")
 
+        return self._generate_execution_tabs(session_id)
+
+    def _generate_execution_tabs(self, session_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield tab dicts built from the session's progress files."""
         # Use ExecutionEngine to get progress data
-        from app.services.execution_engine import ExecutionEngine
-        engine = ExecutionEngine()
+        engine = self.engine
 
-        # Extract username from session_id (format: username_date_timestamp)
-        username = session_id.split('_')[0]
+        username = ParsedSessionId.parse(session_id).username
 
-        try:
-            progress_data = engine.get_session_progress(username, session_id)
-            executions = progress_data.get("executions", {})
+        tabs_count = 0
 
-            tabs = []
-
-            for execution_id, progress in executions.items():
+        try:
+            for execution_id, progress in engine.iter_session_progress(username, session_id):
                 # Parse execution_id to get combination info
                 # Format: {username}_{session_id}_{category}_{product_id}_{plan_id}
-                parts = execution_id.split('_')
+                # Only the last three fields are needed, so split from the right
+                parts = execution_id.rsplit('_', 4)
                 if len(parts) >= 5:
-                    category = parts[-3]
-                    product_id = parts[-2]
-                    plan_id = parts[-1]
+                    category, product_id, plan_id = parts[-3:]
 
                     # Count API steps
                     succeed_count = sum(1 for status in progress.values() if status == "succeed")
@@ -740,18 +756,19 @@ class ExecutionService:
                     # Create tab_id in expected format
                     tab_id = f"tab_{session_id}_{category}_{product_id}_{plan_id}"
 
-                    tabs.append({
+                    tabs_count += 1
+                    yield {
                         "tab_id": tab_id,
                         "status": status,
                         "api_calls_completed": succeed_count + failed_count,  # DEV environment calls only
                         "api_calls_total": total_steps,
                         "has_failures": failed_count > 0 or can_not_proceed_count > 0
-                    })
+                    }
 
                     logger.debug(f"Generated tab: {tab_id} - {status} ({succeed_count}/{total_steps} steps)")
 
             # If no tabs found but session directory exists, return pending tabs
-            if not tabs:
+            if not tabs_count:
                 session_dir = engine.storage_service.create_session_directory(session_id)
                 if session_dir.exists():
                     # Try to infer tabs from config
@@ -767,25 +784,19 @@ class ExecutionService:
 
                             for combination in combinations:
                                 tab_id = f"tab_{session_id}_{combination['category']}_{combination['product_id']}_{combination['plan_id']}"
-                                tabs.append({
+                                tabs_count += 1
+                                yield {
                                     "tab_id": tab_id,
                                     "status": "pending",
                                     "api_calls_completed": 0,
                                     "api_calls_total": 7,  # 7 steps per tab
                                     "has_failures": False
-                                })
+                                }
 
-            logger.info(f"Total tabs for session {session_id}: {len(tabs)}")
+            logger.info(f"Total tabs for session {session_id}: {tabs_count}")
 
         except Exception as e:
             logger.warning(f"Failed to get progress data for tabs: {e}")
-            # Fallback: return empty tabs list
-            tabs = []
-
-        return TabsListResponse(
-            session_id=session_id,
-            tabs=tabs
-        )
 
     def get_tab_progress(
         self,
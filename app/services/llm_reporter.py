@@ -4,8 +4,11 @@ Generates AI-powered reports using Hugging Face LLM.
 Currently placeholder - to be implemented in Phase 3 (LLM Integration).
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
+import threading
+
+import httpx
 
 from app.models.report import Report, APIBreakdown, Issue
 
@@ -15,10 +18,36 @@ logger = logging.getLogger(__name__)
 class LLMReporterService:
     """Service for generating AI-powered reports."""
 
+    # One pooled client per process, shared by every reporter instance so
+    # Hugging Face calls reuse keep-alive connections instead of re-handshaking
+    _http_client: Optional[httpx.Client] = None
+    _http_client_lock = threading.Lock()
+
     def __init__(self):
         self.huggingface_api_key = None
         self.huggingface_model = None
 
+    @property
+    def http_client(self) -> httpx.Client:
+        """Shared HTTP client for Hugging Face inference calls, created on first use."""
+        cls = type(self)
+        if cls._http_client is None:
+            with cls._http_client_lock:
+                if cls._http_client is None:
+                    cls._http_client = httpx.Client(
+                        timeout=httpx.Timeout(60.0, connect=10.0),
+                        limits=httpx.Limits(max_keepalive_connections=32)
+                    )
+        return cls._http_client
+
+    @classmethod
+    def close(cls):
+        """Close the shared HTTP client, if one was opened."""
+        with cls._http_client_lock:
+            if cls._http_client is not None:
+                cls._http_client.close()
+                cls._http_client = None
+
     def generate_execution_report(
         self,
         execution_id: str,
@@ -149,7 +178,8 @@ class LLMReporterService:
             has_critical = summary.get("critical", 0) > 0
             has_failures = comparison.get("has_failures", False)
 
-            api_breakdown.append(APIBreakdown(
+            # Report parts come from stored comparisons we wrote; skip validation
+            api_breakdown.append(APIBreakdown.model_construct(
                 tab_id=execution_data.get("category", "unknown"),
                 status="failed" if has_failures else "completed",
                 issues=self._extract_issues(comparison),
@@ -158,7 +188,7 @@ class LLMReporterService:
 
             for diff in comparison.get("differences", []):
                 if diff.get("severity") == "critical":
-                    critical_issues.append(Issue(
+                    critical_issues.append(Issue.model_construct(
                         severity="critical",
                         api_step=api_step,
                         description=diff.get("description", "Critical difference found"),
@@ -188,7 +218,7 @@ class LLMReporterService:
             len(comparisons)
         )
 
-        return Report(
+        return Report.model_construct(
             report_id=f"rpt_{execution_id}",
             execution_id=execution_id,
             executive_summary=executive_summary,
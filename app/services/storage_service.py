@@ -4,17 +4,35 @@ Handles JSON file storage for sessions and executions.
 Implements atomic writes for data integrity.
 """
 
+import asyncio
 import json
 import os
+import time
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 
+import orjson
+
+from app.core.concurrency import SingleFlight
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+class SessionComparisons(NamedTuple):
+    """Cached comparisons for one session plus the lookup indexes built over them."""
+    expires_at: float
+    execution_ids: Tuple[str, ...]
+    signature: Tuple[int, ...]  # mtime_ns of each execution file, 0 when missing
+    comparisons: List[Dict[str, Any]]
+    by_id: Dict[str, Dict[str, Any]]  # call_id / comparison_id -> first comparison
+    by_execution: Dict[str, List[Dict[str, Any]]]
+    first_by_token: Dict[str, int]  # comparison_id token -> first position in comparisons
+
+
 class StorageService:
     """Service for JSON file storage operations."""
 
@@ -30,6 +48,14 @@ class StorageService:
         self.session_data_dir = self.base_dir / "session_data"
         self.executions_dir = self.base_dir / "executions"
 
+        # execution_id -> (expires_at, mtime_ns, data), least recently stored
+        # first; at most EXECUTION_CACHE_MAX_ENTRIES
+        self._execution_cache: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # session_id -> comparisons and indexes, at most COMPARISON_INDEX_MAX_SESSIONS
+        self._comparison_cache: "OrderedDict[str, SessionComparisons]" = OrderedDict()
+        self._execution_reads = SingleFlight()
+
         self._ensure_directories()
 
     def _ensure_directories(self):
@@ -61,6 +87,9 @@ class StorageService:
         """
         Read JSON file safely.
 
+        Parses with orjson; files orjson rejects but the stdlib accepts (e.g.
+        NaN written by json.dump) fall back to json.loads.
+
         Args:
             file_path: Path to JSON file
 
@@ -71,8 +100,11 @@ class StorageService:
             if not file_path.exists():
                 logger.debug(f"File not found: {file_path}")
                 return None
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            raw = file_path.read_bytes()
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                return json.loads(raw)
         except Exception as e:
             logger.error(f"Failed to read {file_path}: {e}", exc_info=True)
             return None
@@ -124,57 +156,311 @@ class StorageService:
         file_path = self.session_data_dir / f"session_{session_id}.json"
         return self.read_json(file_path)
 
-    def write_execution(self, execution_id: str, execution_data: Dict[str, Any]):
+    def _execution_file_path(self, execution_id: str, create_dir: bool = False) -> Path:
         """
-        Write execution results to storage.
+        Resolve the storage path for an execution.
 
         Args:
             execution_id: Execution identifier (format: session_id_category_product_plan)
-            execution_data: Execution results
+            create_dir: Create the session directory if it doesn't exist
+
+        Returns:
+            Path to the execution JSON file
         """
         # Parse execution_id to get session directory and filename
         # Format: {username}_{date}_{timestamp}_{category}_{product}_{plan}
         parts = execution_id.split('_')
         if len(parts) < 6:  # Minimum: user + date + time + category + product + plan
             # Fallback for old format
-            file_path = self.executions_dir / f"execution_{execution_id}.json"
-        else:
-            # Session directory: username_date_timestamp (first 3 parts)
-            session_dir = '_'.join(parts[:3])  # user_date_timestamp
-            # Filename: category_product_plan (remaining parts)
-            filename = '_'.join(parts[3:])  # category_product_plan
-            session_path = self.executions_dir / session_dir
+            return self.executions_dir / f"execution_{execution_id}.json"
+
+        # Session directory: username_date_timestamp (first 3 parts)
+        session_dir = '_'.join(parts[:3])  # user_date_timestamp
+        # Filename: category_product_plan (remaining parts)
+        filename = '_'.join(parts[3:])  # category_product_plan
+        session_path = self.executions_dir / session_dir
+        if create_dir:
             session_path.mkdir(parents=True, exist_ok=True)
-            file_path = session_path / f"{filename}_progress.json"
+        return session_path / f"{filename}_progress.json"
+
+    def write_execution(self, execution_id: str, execution_data: Dict[str, Any]):
+        """
+        Write execution results to storage.
+
+        Args:
+            execution_id: Execution identifier (format: session_id_category_product_plan)
+            execution_data: Execution results
+        """
+        file_path = self._execution_file_path(execution_id, create_dir=True)
 
         self._atomic_write(file_path, execution_data)
+        self._execution_cache.pop(execution_id, None)
         logger.debug(f"Execution data written: {execution_id} -> {file_path}")
 
     def read_execution(self, execution_id: str) -> Optional[Dict[str, Any]]:
         """
         Read execution data from storage.
 
+        Results are cached for settings.execution_cache_ttl_seconds. Once that
+        window passes the file is only re-parsed if its mtime changed, and if a
+        re-read fails (e.g. a progress file caught mid-write) the last good copy
+        is served instead. Callers must not mutate the returned dict without
+        writing it back through write_execution.
+
         Args:
             execution_id: Execution identifier (format: session_id_category_product_plan)
 
         Returns:
             Execution data or None if not found
         """
-        # Parse execution_id to get session directory and filename
-        # Format: {username}_{date}_{timestamp}_{category}_{product}_{plan}
-        parts = execution_id.split('_')
-        if len(parts) < 6:  # Minimum: user + date + time + category + product + plan
-            # Fallback for old format
-            file_path = self.executions_dir / f"execution_{execution_id}.json"
+        now = time.monotonic()
+        cached = self._execution_cache.get(execution_id)
+
+        if cached and cached[0] > now:
+            return cached[2]
+
+        file_path = self._execution_file_path(execution_id)
+
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._execution_cache.pop(execution_id, None)
+            logger.debug(f"File not found: {file_path}")
+            return None
+
+        expires_at = now + settings.execution_cache_ttl_seconds
+
+        if cached and cached[1] == mtime_ns:
+            self._store_cached(
+                self._execution_cache, execution_id, (expires_at, mtime_ns, cached[2]),
+                settings.execution_cache_max_entries
+            )
+            return cached[2]
+
+        data = self.read_json(file_path)
+
+        if data is None:
+            if cached:
+                logger.warning(f"Serving stale execution data for {execution_id}")
+                return cached[2]
+            return None
+
+        self._store_cached(
+            self._execution_cache, execution_id, (expires_at, mtime_ns, data),
+            settings.execution_cache_max_entries
+        )
+        return data
+
+    def _store_cached(self, cache: OrderedDict, key: str, value: Any, max_entries: int):
+        """
+        Store a cache entry as the most recent one, evicting the oldest past max_entries.
+
+        Args:
+            cache: LRU cache to update
+            key: Cache key
+            value: Entry to store
+            max_entries: Maximum entries to keep (0 disables caching)
+        """
+        with self._cache_lock:
+            if max_entries <= 0:
+                cache.pop(key, None)
+                return
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > max_entries:
+                cache.popitem(last=False)
+
+    async def read_execution_async(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read execution data from an async handler.
+
+        Cache hits and files under settings.inline_read_max_bytes are read on
+        the calling thread, since parsing a few KB costs less than the thread
+        hop. Larger files are read off the event loop, and concurrent reads of
+        the same execution share a single file read.
+
+        Args:
+            execution_id: Execution identifier
+
+        Returns:
+            Execution data or None if not found
+        """
+        cached = self._execution_cache.get(execution_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[2]
+
+        try:
+            size = self._execution_file_path(execution_id).stat().st_size
+        except OSError:
+            size = 0  # Missing file: read_execution just returns None
+
+        if size < settings.inline_read_max_bytes:
+            return self.read_execution(execution_id)
+
+        return await self._execution_reads.do(
+            execution_id,
+            lambda: asyncio.to_thread(self.read_execution, execution_id)
+        )
+
+    async def read_executions_batch(self, execution_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Read several executions concurrently.
+
+        Args:
+            execution_ids: Execution identifiers
+
+        Returns:
+            Execution data in the same order as execution_ids (None where not found)
+        """
+        return list(await asyncio.gather(*(
+            self.read_execution_async(execution_id)
+            for execution_id in execution_ids
+        )))
+
+    def read_session_comparisons(
+        self,
+        session_id: str,
+        execution_ids: List[str]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Read all comparisons for a session together with a lookup index.
+
+        The index maps both call_id and comparison_id to the first matching
+        comparison. Results are cached per session for a few seconds so repeated
+        UI clicks don't re-read every execution file.
+
+        Args:
+            session_id: Session identifier
+            execution_ids: Execution identifiers belonging to the session
+
+        Returns:
+            Tuple of (comparisons in execution order, id -> comparison index)
+        """
+        entry = self._load_session_comparisons(session_id, execution_ids)
+        return entry.comparisons, entry.by_id
+
+    def read_session_comparisons_by_execution(
+        self,
+        session_id: str,
+        execution_ids: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Read all comparisons for a session grouped by the execution they belong to.
+
+        Args:
+            session_id: Session identifier
+            execution_ids: Execution identifiers belonging to the session
+
+        Returns:
+            Dict mapping execution_id to its comparisons in stored order
+        """
+        return self._load_session_comparisons(session_id, execution_ids).by_execution
+
+    def find_comparison_by_call_parts(
+        self,
+        session_id: str,
+        execution_ids: List[str],
+        call_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the first comparison whose comparison_id contains any '_' part of call_id.
+
+        The token index gives the earliest comparison with an exact token match;
+        only comparisons before it need a substring check, so the result is the
+        same as scanning every comparison.
+
+        Args:
+            session_id: Session identifier
+            execution_ids: Execution identifiers belonging to the session
+            call_id: API call identifier
+
+        Returns:
+            Matching comparison or None
+        """
+        entry = self._load_session_comparisons(session_id, execution_ids)
+        parts = set(call_id.split("_"))
+
+        positions = [entry.first_by_token[part] for part in parts if part in entry.first_by_token]
+        limit = min(positions) if positions else len(entry.comparisons)
+
+        for position in range(limit):
+            comparison_id = entry.comparisons[position].get("comparison_id", "")
+            if any(part in comparison_id for part in parts):
+                return entry.comparisons[position]
+
+        return entry.comparisons[limit] if positions else None
+
+    def _execution_files_signature(self, execution_ids: List[str]) -> Tuple[int, ...]:
+        """Modification times of the given executions' files (0 when missing)."""
+        signature = []
+        for execution_id in execution_ids:
+            try:
+                signature.append(self._execution_file_path(execution_id).stat().st_mtime_ns)
+            except OSError:
+                signature.append(0)
+        return tuple(signature)
+
+    def _load_session_comparisons(self, session_id: str, execution_ids: List[str]) -> "SessionComparisons":
+        """Return the cached comparison entry for a session, rebuilding it when stale."""
+        now = time.monotonic()
+        execution_key = tuple(execution_ids)
+        cached = self._comparison_cache.get(session_id)
+
+        if cached and cached.execution_ids == execution_key:
+            if cached.expires_at > now:
+                return cached
+
+            # TTL passed: keep the index as long as no execution file changed
+            signature = self._execution_files_signature(execution_ids)
+            if signature == cached.signature:
+                cached = cached._replace(expires_at=now + settings.comparison_index_ttl_seconds)
+                self._store_cached(
+                    self._comparison_cache, session_id, cached,
+                    settings.comparison_index_max_sessions
+                )
+                return cached
+
+            # Don't let read_execution's own TTL hand back the pre-change data
+            for execution_id, old, new in zip(execution_ids, cached.signature, signature):
+                if old != new:
+                    self._execution_cache.pop(execution_id, None)
         else:
-            # Session directory: username_date_timestamp (first 3 parts)
-            session_dir = '_'.join(parts[:3])  # user_date_timestamp
-            # Filename: category_product_plan (remaining parts)
-            filename = '_'.join(parts[3:])  # category_product_plan
-            session_path = self.executions_dir / session_dir
-            file_path = session_path / f"{filename}_progress.json"
+            signature = self._execution_files_signature(execution_ids)
 
-        return self.read_json(file_path)
+        comparisons = []
+        by_execution = {}
+        for execution_id in execution_ids:
+            execution_data = self.read_execution(execution_id)
+            if execution_data:
+                execution_comparisons = execution_data.get("comparisons", [])
+                by_execution.setdefault(execution_id, []).extend(execution_comparisons)
+                comparisons.extend(execution_comparisons)
+
+        by_id = {}
+        first_by_token = {}
+        for position, comparison in enumerate(comparisons):
+            for key in (comparison.get("call_id"), comparison.get("comparison_id")):
+                if key:
+                    by_id.setdefault(key, comparison)
+            for token in comparison.get("comparison_id", "").split("_"):
+                first_by_token.setdefault(token, position)
+
+        cached = SessionComparisons(
+            expires_at=now + settings.comparison_index_ttl_seconds,
+            execution_ids=execution_key,
+            signature=signature,
+            comparisons=comparisons,
+            by_id=by_id,
+            by_execution=by_execution,
+            first_by_token=first_by_token
+        )
+        self._store_cached(
+            self._comparison_cache, session_id, cached,
+            settings.comparison_index_max_sessions
+        )
+        logger.debug(f"Comparison index built for {session_id}: {len(by_id)} keys")
+
+        return cached
 
     def cleanup_old_sessions(self, max_sessions: int = 5):
         """
@@ -279,6 +565,8 @@ class StorageService:
             session_path = self.executions_dir / session_dir
             execution_file = session_path / f"{filename}.json"
 
+        self._execution_cache.pop(execution_id, None)
+
         if execution_file.exists():
             execution_file.unlink()
             logger.debug(f"Execution deleted: {execution_id} -> {execution_file}")
@@ -15,6 +15,7 @@ API Steps:
 
 from typing import Dict, Any
 from datetime import datetime
+from functools import lru_cache
 
 
 def get_application_submit_payload(
@@ -202,6 +203,25 @@ def get_customer_policy_details_payload(
     }
 
 
+_PAYLOAD_BUILDERS = {
+    "application_submit": get_application_submit_payload,
+    "apply_coupon": get_apply_coupon_payload,
+    "payment_checkout": get_payment_checkout_payload,
+    "admin_policy_list": get_admin_policy_list_payload,
+    "admin_policy_details": get_admin_policy_details_payload,
+    "customer_policy_list": get_customer_policy_list_payload,
+    "customer_policy_details": get_customer_policy_details_payload
+}
+
+
+@lru_cache(maxsize=4096)
+def _get_token_payload(step: str, token: str, policy_id: str | None) -> Dict[str, Any]:
+    """Memoized payload for the policy list/details steps, which depend only on their arguments."""
+    if policy_id is None:
+        return _PAYLOAD_BUILDERS[step](token)
+    return _PAYLOAD_BUILDERS[step](token, policy_id)
+
+
 def get_payload_for_step(
     step: str,
     category: str,
@@ -220,25 +240,17 @@ def get_payload_for_step(
         **kwargs: Additional parameters for specific steps
 
     Returns:
-        Mock request payload for the specified step
+        Mock request payload for the specified step. Policy list/details
+        payloads are memoized and shared between calls; callers must not
+        mutate them.
 
     Raises:
         ValueError: If step is not recognized
     """
-    step_map = {
-        "application_submit": get_application_submit_payload,
-        "apply_coupon": get_apply_coupon_payload,
-        "payment_checkout": get_payment_checkout_payload,
-        "admin_policy_list": get_admin_policy_list_payload,
-        "admin_policy_details": get_admin_policy_details_payload,
-        "customer_policy_list": get_customer_policy_list_payload,
-        "customer_policy_details": get_customer_policy_details_payload
-    }
-
-    if step not in step_map:
+    if step not in _PAYLOAD_BUILDERS:
         raise ValueError(f"Unknown API step: {step}")
 
-    payload_func = step_map[step]
+    payload_func = _PAYLOAD_BUILDERS[step]
 
     # Enhanced handling for dynamic data
     if step == "application_submit":
@@ -252,9 +264,11 @@ def get_payload_for_step(
         return payload_func(application_id, kwargs.get("payment_method", "CREDIT_CARD"), kwargs.get("payment_details"))
     elif step in ["admin_policy_list", "customer_policy_list"]:
         token_key = "admin_token" if "admin" in step else "customer_token"
-        return payload_func(kwargs.get(token_key, ""), kwargs.get("filters"))
+        if kwargs.get("filters"):
+            return payload_func(kwargs.get(token_key, ""), kwargs["filters"])
+        return _get_token_payload(step, kwargs.get(token_key, ""), None)
     elif step in ["admin_policy_details", "customer_policy_details"]:
         token_key = "admin_token" if "admin" in step else "customer_token"
-        return payload_func(kwargs.get(token_key, ""), kwargs.get("policy_id", "policy_12345"))
+        return _get_token_payload(step, kwargs.get(token_key, ""), kwargs.get("policy_id", "policy_12345"))
     else:
         return payload_func()
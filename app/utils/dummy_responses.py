@@ -13,9 +13,12 @@ API Steps:
 7. Customer Policy Details
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+from functools import lru_cache
 import uuid
 
+from app.utils.dummy_payloads import get_payload_for_step
+
 # Configuration for simulated API failures
 PAYMENT_CHECKOUT_FAILURE_CONFIG = {
     "category": "MV4",
@@ -32,6 +35,16 @@ PAYMENT_CHECKOUT_FAILURE_CONFIG = {
     "failing_step": "payment_checkout"
 }
 
+# (step, category, product_id, plan_id) calls that return the simulated failure
+_FAILING_CALLS = frozenset({
+    (
+        PAYMENT_CHECKOUT_FAILURE_CONFIG["failing_step"],
+        PAYMENT_CHECKOUT_FAILURE_CONFIG["category"],
+        PAYMENT_CHECKOUT_FAILURE_CONFIG["product_id"],
+        PAYMENT_CHECKOUT_FAILURE_CONFIG["plan_id"]
+    )
+})
+
 
 def get_application_submit_response(
     category: str,
@@ -292,6 +305,29 @@ def get_customer_policy_details_response(
     }
 
 
+_RESPONSE_BUILDERS = {
+    "application_submit": get_application_submit_response,
+    "apply_coupon": get_apply_coupon_response,
+    "payment_checkout": get_payment_checkout_response,
+    "admin_policy_list": get_admin_policy_list_response,
+    "admin_policy_details": get_admin_policy_details_response,
+    "customer_policy_list": get_customer_policy_list_response,
+    "customer_policy_details": get_customer_policy_details_response
+}
+
+
+@lru_cache(maxsize=1)
+def _get_payment_failure_response() -> Dict[str, Any]:
+    """Static response returned for the configured payment_checkout failure."""
+    return {
+        "status": "failed",
+        "status_code": 400,
+        "error": "Payment processing failed",
+        "message": "Payment checkout failed: Invalid payment details provided",
+        "details": "The payment could not be processed. Please check your card details and try again."
+    }
+
+
 def get_response_for_step(
     step: str,
     category: str,
@@ -310,40 +346,20 @@ def get_response_for_step(
         **kwargs: Additional parameters for specific steps
 
     Returns:
-        Mock API response for the specified step
+        Mock API response for the specified step. The simulated failure
+        response is shared between calls; callers must not mutate it.
 
     Raises:
         ValueError: If step is not recognized
     """
     # Check for configured API failure (MV4_TOKIO_MARINE_COMPREHENSIVE payment_checkout)
-    config = PAYMENT_CHECKOUT_FAILURE_CONFIG
-    if (category == config["category"] and
-        product_id == config["product_id"] and
-        plan_id == config["plan_id"] and
-        step == config["failing_step"]):
-
-        return {
-            "status": "failed",
-            "status_code": 400,
-            "error": "Payment processing failed",
-            "message": "Payment checkout failed: Invalid payment details provided",
-            "details": "The payment could not be processed. Please check your card details and try again."
-        }
-
-    step_map = {
-        "application_submit": get_application_submit_response,
-        "apply_coupon": get_apply_coupon_response,
-        "payment_checkout": get_payment_checkout_response,
-        "admin_policy_list": get_admin_policy_list_response,
-        "admin_policy_details": get_admin_policy_details_response,
-        "customer_policy_list": get_customer_policy_list_response,
-        "customer_policy_details": get_customer_policy_details_response
-    }
+    if (step, category, product_id, plan_id) in _FAILING_CALLS:
+        return _get_payment_failure_response()
 
-    if step not in step_map:
+    if step not in _RESPONSE_BUILDERS:
         raise ValueError(f"Unknown API step: {step}")
 
-    response_func = step_map[step]
+    response_func = _RESPONSE_BUILDERS[step]
 
     # Enhanced handling for consistency
     if step == "application_submit":
@@ -363,3 +379,32 @@ def get_response_for_step(
         return response_func(kwargs.get("policy_id", "policy_12345"))
     else:
         return response_func()
+
+
+def get_payload_and_response_for_step(
+    step: str,
+    category: str,
+    product_id: str,
+    plan_id: str,
+    **kwargs
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Get the dummy request payload and response for an API step in one call.
+
+    Args:
+        step: API step name (1-7)
+        category: Insurance category
+        product_id: Product identifier
+        plan_id: Plan identifier
+        **kwargs: Additional parameters for specific steps, shared by both
+
+    Returns:
+        Tuple of (request payload, API response)
+
+    Raises:
+        ValueError: If step is not recognized
+    """
+    return (
+        get_payload_for_step(step, category, product_id, plan_id, **kwargs),
+        get_response_for_step(step, category, product_id, plan_id, **kwargs)
+    )
@@ -9,9 +9,13 @@ Based on PRD comparison rules:
 - Focus on: policy-related data, business-critical fields
 """
 
-from typing import Dict, Any, Set
+from typing import Dict, Any
+from functools import lru_cache
 import copy
 
+# Leaf values that are immutable and can be shared with the original response
+_ATOMIC_TYPES = (str, int, float, bool, type(None))
+
 
 def normalize_response(
     response: Dict[str, Any],
@@ -20,7 +24,7 @@ def normalize_response(
     """
     Normalize an API response by removing non-comparable fields.
 
-    This function creates a deep copy of the response and removes:
+    This function builds a copy of the response in a single walk, leaving out:
     - Timestamps (created_at, updated_at, timestamp, date fields ending in _at)
     - Environment-specific metadata
     - Request IDs, transaction references (unique identifiers)
@@ -41,70 +45,67 @@ def normalize_response(
     if not isinstance(response, dict):
         return response
 
-    normalized = copy.deepcopy(response)
-    _remove_fields(normalized)
-
-    return normalized
+    return _normalized_copy(response)
 
 
-def _remove_fields(
+def _normalized_copy(
     data: Any,
     depth: int = 0,
     max_depth: int = 10
-) -> None:
+) -> Any:
     """
-    Recursively remove non-comparable fields from data structure.
+    Recursively copy a data structure, skipping non-comparable fields.
+
+    Removed fields are never copied, so a response is walked once instead of
+    being deep-copied and then pruned.
 
     Args:
-        data: Data structure to clean (dict or list)
+        data: Data structure to copy (dict, list or leaf value)
         depth: Current recursion depth
-        max_depth: Maximum recursion depth to prevent infinite loops
+        max_depth: Depth below which values are deep-copied without pruning
+
+    Returns:
+        Normalized copy of data
     """
+    if isinstance(data, _ATOMIC_TYPES):
+        return data
+
     if depth > max_depth:
-        return
+        return copy.deepcopy(data)
 
     if isinstance(data, dict):
-        keys_to_remove = _get_keys_to_remove(data)
-        for key in keys_to_remove:
-            data.pop(key, None)
+        return {
+            key: _normalized_copy(value, depth + 1, max_depth)
+            for key, value in data.items()
+            if not _is_non_comparable(key)
+        }
 
-        for key, value in data.items():
-            if isinstance(value, (dict, list)):
-                _remove_fields(value, depth + 1, max_depth)
+    if isinstance(data, list):
+        return [_normalized_copy(item, depth + 1, max_depth) for item in data]
 
-    elif isinstance(data, list):
-        for item in data:
-            if isinstance(item, (dict, list)):
-                _remove_fields(item, depth + 1, max_depth)
+    return copy.deepcopy(data)
 
 
-def _get_keys_to_remove(data: Dict[str, Any]) -> Set[str]:
+@lru_cache(maxsize=1024)
+def _is_non_comparable(key: str) -> bool:
     """
-    Identify keys that should be removed from comparison.
+    Check whether a key should be left out of comparison.
 
     Args:
-        data: Dictionary to analyze
+        key: Field name
 
     Returns:
-        Set of keys to remove
+        True if the field should be removed
     """
-    keys_to_remove = set()
-
-    for key in data.keys():
-        key_lower = key.lower()
-
-        should_remove = (
-            _is_timestamp_field(key_lower) or
-            _is_environment_metadata(key_lower) or
-            _is_unique_identifier(key_lower) or
-            _is_internal_metadata(key_lower) or
-            _is_non_business_field(key_lower)
-        )
-
-        if should_remove:
-            keys_to_remove.add(key)
-
-    return keys_to_remove
+    key_lower = key.lower()
+
+    return (
+        _is_timestamp_field(key_lower) or
+        _is_environment_metadata(key_lower) or
+        _is_unique_identifier(key_lower) or
+        _is_internal_metadata(key_lower) or
+        _is_non_business_field(key_lower)
+    )
 
 
 def _is_timestamp_field(key: str) -> bool:
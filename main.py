@@ -2,14 +2,19 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from app.api.routes import session_routes, config_routes, report_routes, execution_routes
+from app.core.config import settings
 from app.core.logging import setup_logging
+from app.core.middleware import OptionalGZipMiddleware
+from app.services.api_executor import APIExecutorService
+from app.services.llm_reporter import LLMReporterService
 
 app = FastAPI(
     title="Internal Testing Portal",
     description="Configuration-driven API sanity testing platform for insurance products",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -18,8 +23,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Poll-Ms", "X-Cache"],
 )
 
+app.add_middleware(OptionalGZipMiddleware, minimum_size=1024, compresslevel=6)
+
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 app.include_router(session_routes.router)
@@ -64,13 +72,22 @@ async def health_check():
 async def startup_event():
     """Application startup"""
     setup_logging()
+    APIExecutorService.open_client()
     print("Internal Testing Portal starting up...")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown"""
+    APIExecutorService.close_client()
+    LLMReporterService.close()
     print("Internal Testing Portal shutting down...")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop=settings.uvicorn_loop,
+        http=settings.uvicorn_http
+    )
@@ -97,8 +97,41 @@ function startPolling(callback, interval = POLLING_INTERVAL) {
     return setInterval(callback, interval);
 }
 
+// Conditional polling: resends the last ETag and waits as long as the server suggests
+// (X-Next-Poll-Ms), so idle sessions are polled less and less often
+function startAdaptivePolling(endpoint, onData, interval = POLLING_INTERVAL) {
+    const poller = { timer: null, etag: null, delay: interval, stopped: false };
+
+    async function poll() {
+        try {
+            const headers = { 'X-Poll-Ms': String(poller.delay) };
+            if (poller.etag) headers['If-None-Match'] = poller.etag;
+
+            const response = await fetch(`${API_BASE_URL}${endpoint}`, { headers });
+            const nextDelay = parseInt(response.headers.get('X-Next-Poll-Ms'), 10);
+            if (!Number.isNaN(nextDelay)) poller.delay = nextDelay;
+
+            if (response.status !== 304) {
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                poller.etag = response.headers.get('ETag');
+                await onData(await response.json());
+            }
+        } catch (error) {
+            console.error('[POLL] Polling request failed:', error);
+        }
+
+        if (!poller.stopped) poller.timer = setTimeout(poll, poller.delay);
+    }
+
+    poller.timer = setTimeout(poll, poller.delay);
+    return poller;
+}
+
 function stopPolling(intervalId) {
-    if (intervalId) {
+    if (intervalId && typeof intervalId === 'object') {
+        intervalId.stopped = true;
+        clearTimeout(intervalId.timer);
+    } else if (intervalId) {
         clearInterval(intervalId);
     }
 }
@@ -122,6 +155,7 @@ window.testingPortal = {
     formatTimestamp,
     getURLParams,
     startPolling,
+    startAdaptivePolling,
     stopPolling,
     navigateTo,
     POLLING_INTERVAL,
@@ -284,12 +284,12 @@ document.addEventListener('DOMContentLoaded', async () => {
     }
 
     // Load execution progress and overall status
-    async function loadExecutionProgressData() {
+    async function loadExecutionProgressData(polledData = null) {
         try {
             console.log('[DEBUG] Loading execution progress for session:', sessionId);
             console.log('[DEBUG] Current executionIds state:', executionIds);
 
-            const data = await window.testingPortal.apiCall(`/api/execution/progress/${sessionId}`);
+            const data = polledData || await window.testingPortal.apiCall(`/api/execution/progress/${sessionId}`);
             console.log('[DEBUG] Raw progress response:', data);
             console.log('[DEBUG] Backend execution IDs in response:', Object.keys(data.executions || {}));
 
@@ -385,13 +385,53 @@ document.addEventListener('DOMContentLoaded', async () => {
     loadExecutions();
     await loadExecutionProgressData();
 
-    // Start polling
-    pollingInterval = window.testingPortal.startPolling(async () => {
-        await loadExecutionProgressData();
-    });
+    // Prefer server-pushed progress; fall back to polling (backs off while
+    // progress is unchanged) if the event stream is unavailable
+    let progressStream = null;
+
+    function startProgressPolling() {
+        pollingInterval = window.testingPortal.startAdaptivePolling(
+            `/api/execution/progress/${sessionId}`,
+            loadExecutionProgressData
+        );
+    }
+
+    if (window.EventSource) {
+        progressStream = new EventSource(
+            `${window.testingPortal.API_BASE_URL}/api/execution/progress/${sessionId}/stream`
+        );
+        // The first event is a full snapshot; `delta` events carry only the
+        // executions that changed and are merged into it
+        let streamedProgress = null;
+        progressStream.onmessage = (event) => {
+            streamedProgress = JSON.parse(event.data);
+            loadExecutionProgressData(streamedProgress);
+        };
+        progressStream.addEventListener('delta', (event) => {
+            if (!streamedProgress) return;
+            const delta = JSON.parse(event.data);
+            Object.assign(streamedProgress.executions, delta.executions);
+            loadExecutionProgressData(streamedProgress);
+        });
+        // Sent once every execution has completed or failed; the server then
+        // closes the stream, so close it here instead of falling back to polling
+        progressStream.addEventListener('complete', () => {
+            progressStream.close();
+            progressStream = null;
+        });
+        progressStream.onerror = () => {
+            console.warn('[SSE] Progress stream failed, falling back to polling');
+            progressStream.close();
+            progressStream = null;
+            startProgressPolling();
+        };
+    } else {
+        startProgressPolling();
+    }
     
     // Cleanup on page unload
     window.addEventListener('beforeunload', () => {
+        if (progressStream) progressStream.close();
         window.testingPortal.stopPolling(pollingInterval);
     });
 
@@ -0,0 +1,51 @@
+"""Tests for ResponseCache"""
+
+from app.core import cache
+from app.core.cache import ResponseCache
+
+
+def test_get_requires_matching_version():
+    response_cache = ResponseCache(ttl_seconds=60)
+    response_cache.set(("progress", "session_1"), b"{}", version='W/"v1"')
+
+    assert response_cache.get(("progress", "session_1"), version='W/"v1"') == b"{}"
+    assert response_cache.get(("progress", "session_1"), version='W/"v2"') is None
+    assert response_cache.get(("progress", "session_1")) is None
+
+
+def test_expired_entry_is_only_served_stale(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+    response_cache = ResponseCache(ttl_seconds=2)
+    response_cache.set(("status", "session_1"), b"{}")
+
+    now += 3
+
+    assert response_cache.get(("status", "session_1")) is None
+    assert response_cache.get_stale(("status", "session_1")) == b"{}"
+
+
+def test_evicts_least_recently_stored_entry():
+    response_cache = ResponseCache(ttl_seconds=60, max_entries=2)
+    response_cache.set(("status", "session_1"), b"1")
+    response_cache.set(("status", "session_2"), b"2")
+    # Storing session_1 again makes session_2 the oldest
+    response_cache.set(("status", "session_1"), b"1b")
+    response_cache.set(("status", "session_3"), b"3")
+
+    assert response_cache.get_stale(("status", "session_2")) is None
+    assert response_cache.get(("status", "session_1")) == b"1b"
+    assert response_cache.get(("status", "session_3")) == b"3"
+
+
+def test_invalidate_session_drops_only_that_session():
+    response_cache = ResponseCache(ttl_seconds=60)
+    response_cache.set(("status", "session_1"), b"1")
+    response_cache.set(("tabs", "session_1"), b"1")
+    response_cache.set(("status", "session_2"), b"2")
+
+    response_cache.invalidate_session("session_1")
+
+    assert response_cache.get_stale(("status", "session_1")) is None
+    assert response_cache.get_stale(("tabs", "session_1")) is None
+    assert response_cache.get(("status", "session_2")) == b"2"
@@ -0,0 +1,30 @@
+"""Tests for ComparisonService"""
+
+from app.models.comparison import Difference
+from app.services.comparison_service import ComparisonService
+
+
+def _difference(severity: str) -> Difference:
+    return Difference(
+        field_path="data.premium",
+        target_value=1,
+        staging_value=2,
+        severity=severity,
+        description="Value changed"
+    )
+
+
+def test_generate_summary_counts_mixed_severities():
+    differences = [_difference(severity) for severity in ("warning", "critical", "info", "warning")]
+
+    summary = ComparisonService()._generate_summary(differences)
+
+    assert summary == {"critical": 1, "warning": 2, "info": 1, "total": 4}
+    assert list(summary) == ["critical", "warning", "info", "total"]
+
+
+def test_generate_summary_empty_differences():
+    summary = ComparisonService()._generate_summary([])
+
+    assert summary == {"critical": 0, "warning": 0, "info": 0, "total": 0}
+    assert list(summary) == ["critical", "warning", "info", "total"]
@@ -0,0 +1,113 @@
+"""Tests for the SingleFlight and CoalescingFileWriter helpers"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core import concurrency
+from app.core.concurrency import CoalescingFileWriter, SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call_between_waiters():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def read():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"status": "completed"}
+
+    waiters = [asyncio.create_task(single_flight.do("session_1", read)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert calls == 1
+    assert results == [{"status": "completed"}] * 3
+    assert results[0] is results[1] is results[2]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_survives_cancelled_waiter():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def read():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "progress"
+
+    cancelled = asyncio.create_task(single_flight.do("session_1", read))
+    waiting = asyncio.create_task(single_flight.do("session_1", read))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    release.set()
+    assert await waiting == "progress"
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_runs_again_after_completion():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def read():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await single_flight.do("session_1", read) == 1
+    assert await single_flight.do("session_1", read) == 2
+
+
+def test_writer_drops_superseded_snapshot(tmp_path, monkeypatch):
+    writer = CoalescingFileWriter()
+    path = tmp_path / "combination_progress.json"
+    written = []
+    real_replace = concurrency.os.replace
+
+    def recording_replace(src, dst):
+        written.append(open(src, "rb").read())
+        real_replace(src, dst)
+
+    monkeypatch.setattr(concurrency.os, "replace", recording_replace)
+
+    # Hold the single worker so both snapshots are queued before either is written
+    worker_busy = threading.Event()
+    writer._executor.submit(worker_busy.wait)
+    writer.submit(path, b'{"step": 1}')
+    writer.submit(path, b'{"step": 2}')
+    worker_busy.set()
+    writer.flush()
+
+    assert written == [b'{"step": 2}']
+    assert path.read_bytes() == b'{"step": 2}'
+
+
+def test_writer_flush_orders_writes(tmp_path):
+    writer = CoalescingFileWriter()
+    progress_file = tmp_path / "combination_progress.json"
+    other_file = tmp_path / "other_progress.json"
+
+    writer.submit(progress_file, b'{"step": 1}')
+    writer.submit(other_file, b'{"step": 1}')
+    writer.flush()
+
+    assert progress_file.read_bytes() == b'{"step": 1}'
+    assert other_file.read_bytes() == b'{"step": 1}'
+
+    writer.submit(progress_file, b'{"step": 2}')
+    writer.flush()
+
+    assert progress_file.read_bytes() == b'{"step": 2}'
+    assert not progress_file.with_suffix(".tmp").exists()
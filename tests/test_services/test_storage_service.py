@@ -0,0 +1,83 @@
+"""Tests for StorageService comparison lookups"""
+
+import random
+
+import pytest
+
+from app.services.storage_service import StorageService
+
+SESSION_ID = "bob_20260115_120000"
+
+
+def _linear_scan(comparisons, call_id):
+    """The full scan get_comparison used before the token index."""
+    for comp in comparisons:
+        call_id_parts = call_id.split("_")
+        if any(part in comp.get("comparison_id", "") for part in call_id_parts):
+            return comp
+    return None
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return StorageService(base_dir=str(tmp_path))
+
+
+def _write_comparisons(storage, comparisons_by_execution):
+    execution_ids = []
+    for execution_id, comparisons in comparisons_by_execution.items():
+        storage.write_execution(execution_id, {"comparisons": comparisons})
+        execution_ids.append(execution_id)
+    return execution_ids
+
+
+@pytest.mark.parametrize("call_id", [
+    "call_exec1_application_submit_dev",
+    "call_exec2_customer_policy_details_staging",
+    "apply_coupon",
+    "policy",                  # substring of tokens, never an exact token
+    "details",                 # exact token appearing late
+    "call__dev",               # empty part matches every comparison_id
+    "nothing-matches-here",
+])
+def test_find_comparison_by_call_parts_matches_linear_scan(storage, call_id):
+    execution_ids = _write_comparisons(storage, {
+        f"{SESSION_ID}_MV4_SOMPO_COMPREHENSIVE": [
+            {"comparison_id": "cmp_exec1_application_submit", "call_id": "a"},
+            {"comparison_id": "cmp_exec1_apply_coupon", "call_id": "b"},
+            {"call_id": "no_comparison_id"},
+        ],
+        f"{SESSION_ID}_MV4_TOKIO_MARINE_TOTAL_LOSS": [
+            {"comparison_id": "cmp_exec2_admin_policylist", "call_id": "c"},
+            {"comparison_id": "cmp_exec2_customer_policy_details", "call_id": "d"},
+        ],
+    })
+    comparisons, _ = storage.read_session_comparisons(SESSION_ID, execution_ids)
+
+    expected = _linear_scan(comparisons, call_id)
+    found = storage.find_comparison_by_call_parts(SESSION_ID, execution_ids, call_id)
+
+    assert found is expected
+
+
+def test_find_comparison_by_call_parts_matches_linear_scan_randomized(storage):
+    rng = random.Random(1234)
+    tokens = ["cmp", "exec", "exec1", "apply", "coupon", "pay", "payment", "dev", "qa", "x", ""]
+
+    def random_id():
+        return "_".join(rng.choice(tokens) for _ in range(rng.randint(1, 4)))
+
+    execution_ids = _write_comparisons(storage, {
+        f"{SESSION_ID}_MV4_PLAN_{index}": [
+            {"comparison_id": random_id(), "call_id": f"call_{index}_{position}"}
+            for position in range(rng.randint(0, 5))
+        ]
+        for index in range(6)
+    })
+    comparisons, _ = storage.read_session_comparisons(SESSION_ID, execution_ids)
+
+    for _ in range(300):
+        call_id = random_id()
+        expected = _linear_scan(comparisons, call_id)
+        found = storage.find_comparison_by_call_parts(SESSION_ID, execution_ids, call_id)
+        assert found is expected, call_id